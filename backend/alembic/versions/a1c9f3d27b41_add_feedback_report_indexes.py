@@ -0,0 +1,52 @@
+"""Add composite indexes for feedback and timing report queries
+
+Revision ID: a1c9f3d27b41
+Revises: f49aee6af5b2
+Create Date: 2025-09-01 10:12:33.481294
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1c9f3d27b41'
+down_revision: Union[str, Sequence[str], None] = 'f49aee6af5b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Timing/trust/fatigue reports filter questions by recipient or
+    # template combined with a created_at range; feedback lookups join on
+    # question_id. These composite indexes turn those scans into
+    # index-range scans. team_member_profiles.team_id is already indexed
+    # by the model definition.
+    op.create_index(
+        'ix_generated_question_recipient_created',
+        'generated_questions',
+        ['recipient_id', sa.text('created_at DESC')],
+    )
+    op.create_index(
+        'ix_generated_question_template_created',
+        'generated_questions',
+        ['template_id', sa.text('created_at DESC')],
+    )
+    op.create_index(
+        'ix_interaction_feedback_question',
+        'interaction_feedback',
+        ['question_id'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_interaction_feedback_question', table_name='interaction_feedback')
+    op.drop_index(
+        'ix_generated_question_template_created', table_name='generated_questions'
+    )
+    op.drop_index(
+        'ix_generated_question_recipient_created', table_name='generated_questions'
+    )
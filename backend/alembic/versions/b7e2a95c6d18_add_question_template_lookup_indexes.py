@@ -0,0 +1,47 @@
+"""Add lookup indexes for question template selection
+
+Revision ID: b7e2a95c6d18
+Revises: a1c9f3d27b41
+Create Date: 2025-09-01 11:02:48.917356
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2a95c6d18'
+down_revision: Union[str, Sequence[str], None] = 'a1c9f3d27b41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Template selection filters on (question_type, complexity, is_active)
+    # and ranks by effectiveness_score; the composite index lets Postgres
+    # return the top row without a sort. The GIN expression index backs
+    # the jsonb @> containment check on target_roles.
+    op.execute(
+        'CREATE INDEX ix_question_template_target_roles_gin '
+        'ON question_templates USING GIN ((target_roles::jsonb) jsonb_path_ops)'
+    )
+    op.create_index(
+        'ix_question_template_selection',
+        'question_templates',
+        [
+            'question_type',
+            'complexity',
+            'is_active',
+            sa.text('effectiveness_score DESC'),
+        ],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_question_template_selection', table_name='question_templates')
+    op.drop_index(
+        'ix_question_template_target_roles_gin', table_name='question_templates'
+    )
@@ -0,0 +1,46 @@
+"""Add quality_score column to question_responses
+
+Revision ID: c4f8d13a7e52
+Revises: b7e2a95c6d18
+Create Date: 2025-09-01 12:21:07.634815
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f8d13a7e52'
+down_revision: Union[str, Sequence[str], None] = 'b7e2a95c6d18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Promote quality_score out of the quality_indicators JSON blob so
+    # analytics can AVG() an indexed numeric column instead of parsing
+    # JSON per row; backfill existing responses from the JSON key.
+    op.add_column(
+        'question_responses',
+        sa.Column('quality_score', sa.Float(), nullable=True),
+    )
+    op.create_index(
+        'ix_question_responses_quality_score',
+        'question_responses',
+        ['quality_score'],
+    )
+    op.execute(
+        "UPDATE question_responses "
+        "SET quality_score = CAST(quality_indicators->>'quality_score' AS FLOAT) "
+        "WHERE quality_indicators->>'quality_score' IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_question_responses_quality_score', table_name='question_responses'
+    )
+    op.drop_column('question_responses', 'quality_score')
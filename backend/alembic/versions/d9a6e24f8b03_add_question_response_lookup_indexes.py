@@ -0,0 +1,44 @@
+"""Add composite lookup indexes to question_responses
+
+Revision ID: d9a6e24f8b03
+Revises: c4f8d13a7e52
+Create Date: 2025-09-01 13:40:52.208174
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9a6e24f8b03'
+down_revision: Union[str, Sequence[str], None] = 'c4f8d13a7e52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # collect_response looks up the existing response by
+    # (question_id, responder_id) and the reminder gate checks EXISTS on
+    # (question_id, status); both become single B-tree lookups.
+    op.create_index(
+        'ix_question_response_question_responder',
+        'question_responses',
+        ['question_id', 'responder_id'],
+    )
+    op.create_index(
+        'ix_question_response_question_status',
+        'question_responses',
+        ['question_id', 'status'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_question_response_question_status', table_name='question_responses'
+    )
+    op.drop_index(
+        'ix_question_response_question_responder', table_name='question_responses'
+    )
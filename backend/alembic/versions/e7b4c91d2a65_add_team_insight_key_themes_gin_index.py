@@ -0,0 +1,33 @@
+"""Add GIN index on team_insights key_themes
+
+Revision ID: e7b4c91d2a65
+Revises: d9a6e24f8b03
+Create Date: 2025-09-01 16:05:33.481920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b4c91d2a65'
+down_revision: Union[str, Sequence[str], None] = 'd9a6e24f8b03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Category filtering in generate_actionable_recommendations uses the
+    # jsonb ?| array-overlap operator on key_themes; a GIN expression
+    # index over the jsonb cast lets it prune rows before hydration.
+    op.execute(
+        "CREATE INDEX ix_team_insight_key_themes_gin "
+        "ON team_insights USING GIN ((key_themes::jsonb))"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_team_insight_key_themes_gin', table_name='team_insights')
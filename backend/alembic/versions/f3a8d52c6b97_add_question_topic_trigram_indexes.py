@@ -0,0 +1,43 @@
+"""Add trigram indexes for question topic search
+
+Revision ID: f3a8d52c6b97
+Revises: e7b4c91d2a65
+Create Date: 2025-09-01 16:42:18.907245
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a8d52c6b97'
+down_revision: Union[str, Sequence[str], None] = 'e7b4c91d2a65'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Topic lookups in the insight service run ILIKE '%topic%' over
+    # question text and context; trigram GIN indexes make those substring
+    # scans index-assisted instead of sequential.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX ix_generated_question_text_trgm "
+        "ON generated_questions USING GIN (question_text gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_generated_question_context_trgm "
+        "ON generated_questions USING GIN ((context::text) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_generated_question_context_trgm', table_name='generated_questions'
+    )
+    op.drop_index(
+        'ix_generated_question_text_trgm', table_name='generated_questions'
+    )
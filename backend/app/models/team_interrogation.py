@@ -176,6 +176,11 @@ class TeamMemberProfile(Base):
     )
     responses = relationship("QuestionResponse", back_populates="responder")
 
+    @property
+    def primary_channel(self) -> str:
+        """First preferred channel, falling back to email"""
+        return self.preferred_channels[0] if self.preferred_channels else "email"
+
     __table_args__ = (
         Index("idx_team_member_team_role", "team_id", "role"),
         Index("idx_team_member_response_rate", "response_rate"),
@@ -243,13 +248,21 @@ class GeneratedQuestion(Base):
         foreign_keys=[recipient_id],
         back_populates="questions_received",
     )
-    responses = relationship("QuestionResponse", back_populates="question")
+    responses = relationship(
+        "QuestionResponse",
+        back_populates="question",
+        order_by="QuestionResponse.created_at",
+    )
     follow_ups = relationship("GeneratedQuestion", remote_side=[parent_question_id])
     parent = relationship("GeneratedQuestion", remote_side=[id], overlaps="follow_ups")
 
     __table_args__ = (
         Index("idx_generated_question_recipient_status", "recipient_id", "sent_at"),
         Index("idx_generated_question_scheduled", "scheduled_for"),
+        Index(
+            "ix_generated_question_recipient_created", "recipient_id", "created_at"
+        ),
+        Index("ix_generated_question_template_created", "template_id", "created_at"),
     )
 
 class QuestionResponse(Base):
@@ -290,6 +303,9 @@ class QuestionResponse(Base):
 
     # Quality and sentiment
     sentiment_score: Mapped[Optional[float]] = mapped_column(Float)  # -1.0 to 1.0
+    quality_score: Mapped[Optional[float]] = mapped_column(
+        Float, index=True
+    )  # 0.0 to 1.0, promoted from quality_indicators for SQL aggregation
     quality_indicators: Mapped[Dict[str, Any]] = mapped_column(JSON, default=dict)
     follow_up_needed: Mapped[bool] = mapped_column(Boolean, default=False)
 
@@ -309,6 +325,8 @@ class QuestionResponse(Base):
     __table_args__ = (
         Index("idx_question_response_status", "status"),
         Index("idx_question_response_completed", "completed_at"),
+        Index("ix_question_response_question_responder", "question_id", "responder_id"),
+        Index("ix_question_response_question_status", "question_id", "status"),
     )
 
 class TeamInsight(Base):
@@ -427,6 +445,7 @@ class InteractionFeedback(Base):
     __table_args__ = (
         Index("idx_interaction_feedback_rating", "interaction_rating"),
         Index("idx_interaction_feedback_created", "created_at"),
+        Index("ix_interaction_feedback_question", "question_id"),
     )
 
 class CommunicationPattern(Base):
@@ -13,11 +13,17 @@ Handles continuous improvement of the team interrogation system including:
 
 from typing import Any, Dict, List, Optional, Tuple
 
+import asyncio
 import statistics
+from itertools import islice
+
+import numpy as np
 from collections import defaultdict
 from datetime import datetime, timedelta
+from functools import cached_property, lru_cache
 
-from sqlalchemy import and_, desc, func, or_
+from sqlalchemy import JSON, and_, any_, cast, desc, func, or_, select, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Session
 
 from ..core.config import settings
@@ -28,15 +34,92 @@ from ..models.team_interrogation import (CommunicationPattern,
                                          TeamMemberProfile, TrustLevel)
 from ..models.user import User
 from .communication_service import CommunicationService
+from .llm_cache import llm_cache
 from .llm_service import LLMService
 
+_DAY_NAMES = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+
+# trust_change values stored on InteractionFeedback
+_TRUST_INCREASED = "increased"
+_TRUST_DECREASED = "decreased"
+
+def _improvement_priority_kernel(
+    usage_count: int, response_rate: float, avg_quality: float, avg_rating: float
+) -> float:
+    """Score template improvement priority from primitive metrics"""
+
+    priority = 0.0
+
+    # High usage but poor performance = high priority
+    if usage_count > 10:
+        priority += 0.3
+
+    # Poor metrics = higher priority
+    if response_rate < 0.5:
+        priority += 0.4
+    if avg_quality < 0.5:
+        priority += 0.3
+    if avg_rating < 2.5:
+        priority += 0.5
+
+    return priority if priority < 1.0 else 1.0
+
+@lru_cache(maxsize=1)
+def get_llm_service() -> LLMService:
+    """Process-wide LLM service so client setup happens once, not per request"""
+    return LLMService()
+
+def _signal_passthrough(source_key: str):
+    """Build a handler that copies a signal value through unchanged"""
+
+    def _extract(interaction_data: Dict[str, Any]) -> Any:
+        return interaction_data[source_key]
+
+    return _extract
+
+def _merge_preferred_channels(interaction_data: Dict[str, Any]) -> Optional[List[str]]:
+    """Merge a newly preferred channel into the existing channel ranking"""
+
+    current_channels = interaction_data.get("current_preferred_channels", [])
+    new_channel = interaction_data["preferred_channel"]
+    if new_channel in current_channels:
+        return None
+    current_channels.insert(0, new_channel)  # Add to front
+    return current_channels[:3]  # Keep top 3
+
+# Maps interaction-data keys to (profile field, handler); handlers returning
+# None produce no preference update
+_SIGNAL_MAP = {
+    "preferred_formality": (
+        "formality_preference",
+        _signal_passthrough("preferred_formality"),
+    ),
+    "preferred_channel": ("preferred_channels", _merge_preferred_channels),
+    "optimal_response_time": (
+        "response_time_preference",
+        _signal_passthrough("optimal_response_time"),
+    ),
+}
+
 class FeedbackImprovementService:
     """Service for feedback collection and continuous improvement"""
 
     def __init__(self, db: Session):
         self.db = db
-        self.llm_service = LLMService()
-        self.communication_service = CommunicationService(db)
+        self.llm_service = get_llm_service()
+
+    @cached_property
+    def communication_service(self) -> CommunicationService:
+        """Lazily constructed on first use; most calls never need it"""
+        return CommunicationService(self.db)
 
     async def collect_interaction_feedback(
         self, question_id: str, responder_id: str, feedback_data: Dict[str, Any]
@@ -94,12 +177,32 @@ class FeedbackImprovementService:
             "tracked_at": datetime.utcnow(),
         }
 
-        # Update response quality indicators
-        if not response.quality_indicators:
-            response.quality_indicators = {}
-
-        response.quality_indicators["leader_usefulness"] = usefulness_rating
-        response.quality_indicators["leader_feedback"] = specific_feedback
+        # Update response quality indicators with targeted jsonb_set calls
+        # instead of loading and rewriting the whole JSON document
+        self.db.execute(
+            update(QuestionResponse)
+            .where(QuestionResponse.id == response_id)
+            .values(
+                # The column is json, not jsonb, so cast the jsonb_set
+                # result back; Postgres has no implicit jsonb->json
+                # assignment cast
+                quality_indicators=cast(
+                    func.jsonb_set(
+                        func.jsonb_set(
+                            func.coalesce(
+                                cast(QuestionResponse.quality_indicators, JSONB),
+                                cast({}, JSONB),
+                            ),
+                            "{leader_usefulness}",
+                            cast(usefulness_rating, JSONB),
+                        ),
+                        "{leader_feedback}",
+                        cast(specific_feedback, JSONB),
+                    ),
+                    JSON,
+                )
+            )
+        )
 
         self.db.commit()
 
@@ -134,6 +237,7 @@ class FeedbackImprovementService:
                 updated_fields.append(f"{field}: {old_value} -> {new_value}")
 
         # Learn communication patterns
+        pattern = None
         if preference_updates:
             pattern = await self.communication_service.learn_communication_pattern(
                 responder_id,
@@ -147,7 +251,7 @@ class FeedbackImprovementService:
         return {
             "responder_id": responder_id,
             "updated_fields": updated_fields,
-            "learned_patterns": pattern.id if "pattern" in locals() else None,
+            "learned_patterns": pattern.id if pattern is not None else None,
             "learning_confidence": await self._calculate_learning_confidence(
                 responder_id
             ),
@@ -225,11 +329,12 @@ class FeedbackImprovementService:
         if not interactions:
             return {"error": "No recent interactions found"}
 
-        # Analyze trust progression
-        trust_metrics = await self._calculate_trust_metrics(member, interactions)
-
-        # Identify trust building factors
-        trust_factors = await self._identify_trust_factors(member_id, interactions)
+        # Analyze trust progression and building factors concurrently;
+        # recommendations depend on the metrics so they stay sequential
+        trust_metrics, trust_factors = await asyncio.gather(
+            self._calculate_trust_metrics(member, interactions),
+            self._identify_trust_factors(member_id, interactions),
+        )
 
         # Generate trust building recommendations
         trust_recommendations = await self._generate_trust_recommendations(
@@ -346,27 +451,42 @@ class FeedbackImprovementService:
                 TeamMemberProfile.team_id == team_id
             )
 
-        feedback_data = feedback_query.filter(
-            InteractionFeedback.created_at
-            > datetime.utcnow() - timedelta(days=timeframe_days)
-        ).all()
+        # yield_per hydrates rows in fixed-size batches instead of one
+        # fetchall spike; the analyses below share the rows, so they are
+        # still collected, but peak hydration memory is bounded per batch
+        feedback_data = list(
+            feedback_query.filter(
+                InteractionFeedback.created_at
+                > datetime.utcnow() - timedelta(days=timeframe_days)
+            ).yield_per(1000)
+        )
 
         if not feedback_data:
             return {"error": "Insufficient feedback data"}
 
-        # Analyze different improvement areas
+        # Analyze the independent improvement areas concurrently
+        (
+            feedback_summary,
+            communication_effectiveness,
+            question_quality,
+            trust_and_rapport,
+            fatigue_patterns,
+        ) = await asyncio.gather(
+            self._analyze_feedback_summary(feedback_data),
+            self._analyze_communication_effectiveness(feedback_data),
+            self._analyze_question_quality_trends(feedback_data),
+            self._analyze_trust_trends(feedback_data),
+            self._analyze_fatigue_patterns(feedback_data),
+        )
+
         report = {
             "report_period": f"{timeframe_days} days",
             "scope": f"team_{team_id}" if team_id else "system_wide",
-            "feedback_summary": await self._analyze_feedback_summary(feedback_data),
-            "communication_effectiveness": await self._analyze_communication_effectiveness(
-                feedback_data
-            ),
-            "question_quality": await self._analyze_question_quality_trends(
-                feedback_data
-            ),
-            "trust_and_rapport": await self._analyze_trust_trends(feedback_data),
-            "fatigue_patterns": await self._analyze_fatigue_patterns(feedback_data),
+            "feedback_summary": feedback_summary,
+            "communication_effectiveness": communication_effectiveness,
+            "question_quality": question_quality,
+            "trust_and_rapport": trust_and_rapport,
+            "fatigue_patterns": fatigue_patterns,
             "improvement_priorities": [],
             "implementation_roadmap": [],
         }
@@ -407,18 +527,19 @@ class FeedbackImprovementService:
 
         question = response.question
 
-        # If highly useful, reinforce similar question patterns
+        # If highly useful, reinforce similar question patterns with one
+        # atomic UPDATE instead of a SELECT-then-UPDATE read-modify-write
         if usefulness_rating >= 4:
             if question.template_id:
-                template = (
-                    self.db.query(QuestionTemplate)
-                    .filter(QuestionTemplate.id == question.template_id)
-                    .first()
-                )
-                if template:
-                    template.effectiveness_score = min(
-                        1.0, template.effectiveness_score + 0.1
+                self.db.execute(
+                    update(QuestionTemplate)
+                    .where(QuestionTemplate.id == question.template_id)
+                    .values(
+                        effectiveness_score=func.least(
+                            1.0, QuestionTemplate.effectiveness_score + 0.1
+                        )
                     )
+                )
 
         # If not useful, analyze what went wrong
         elif usefulness_rating <= 2:
@@ -433,25 +554,11 @@ class FeedbackImprovementService:
 
         preferences = {}
 
-        # Communication style preferences
-        if "preferred_formality" in interaction_data:
-            preferences["formality_preference"] = interaction_data[
-                "preferred_formality"
-            ]
-
-        # Channel preferences
-        if "preferred_channel" in interaction_data:
-            current_channels = interaction_data.get("current_preferred_channels", [])
-            new_channel = interaction_data["preferred_channel"]
-            if new_channel not in current_channels:
-                current_channels.insert(0, new_channel)  # Add to front
-                preferences["preferred_channels"] = current_channels[:3]  # Keep top 3
-
-        # Timing preferences
-        if "optimal_response_time" in interaction_data:
-            preferences["response_time_preference"] = interaction_data[
-                "optimal_response_time"
-            ]
+        for source_key, (target_field, handler) in _SIGNAL_MAP.items():
+            if source_key in interaction_data:
+                value = handler(interaction_data)
+                if value is not None:
+                    preferences[target_field] = value
 
         return preferences
 
@@ -465,41 +572,69 @@ class FeedbackImprovementService:
             .count()
         )
 
-        # More interactions = higher confidence
-        confidence = min(
-            1.0, interaction_count / 20.0
-        )  # Max confidence at 20 interactions
+        # More interactions = higher confidence; max confidence at 20 interactions
+        confidence = interaction_count / 20.0
+
+        return confidence if confidence < 1.0 else 1.0
+
+    def _first_response_subquery(self, question_ids: List[str]):
+        """Subquery selecting responses ranked per question (rn == 1 is earliest)"""
 
-        return confidence
+        return (
+            select(
+                QuestionResponse.question_id,
+                QuestionResponse.response_time_seconds,
+                QuestionResponse.quality_indicators,
+                func.row_number()
+                .over(
+                    partition_by=QuestionResponse.question_id,
+                    order_by=QuestionResponse.created_at,
+                )
+                .label("rn"),
+            )
+            .filter(QuestionResponse.question_id == any_(question_ids))
+            .subquery()
+        )
 
     async def _analyze_timing_effectiveness(
         self, questions: List[GeneratedQuestion]
     ) -> Dict[str, Any]:
         """Analyze timing effectiveness patterns"""
 
-        timing_data = []
+        # Fetch only the columns the analysis needs instead of hydrating
+        # full question/response ORM objects; a window function restricts
+        # the join to the earliest response per question in the database
+        question_ids = [q.id for q in questions]
+        first_response = self._first_response_subquery(question_ids)
+
+        rows = self.db.execute(
+            select(
+                GeneratedQuestion.sent_at,
+                first_response.c.response_time_seconds,
+                first_response.c.quality_indicators,
+            )
+            .join(
+                first_response,
+                first_response.c.question_id == GeneratedQuestion.id,
+            )
+            .filter(first_response.c.rn == 1)
+        ).all()
 
-        for question in questions:
-            responses = question.responses
-            if responses:
-                response = responses[0]  # Take first response
+        timing_data = []
 
-                timing_data.append(
-                    {
-                        "sent_hour": (
-                            question.sent_at.hour if question.sent_at else None
-                        ),
-                        "sent_day": (
-                            question.sent_at.weekday() if question.sent_at else None
-                        ),
-                        "response_time": response.response_time_seconds,
-                        "response_quality": (
-                            response.quality_indicators.get("quality_score", 0.5)
-                            if response.quality_indicators
-                            else 0.5
-                        ),
-                    }
-                )
+        for sent_at, response_time, quality_indicators in rows:
+            timing_data.append(
+                {
+                    "sent_hour": sent_at.hour if sent_at else None,
+                    "sent_day": sent_at.weekday() if sent_at else None,
+                    "response_time": response_time,
+                    "response_quality": (
+                        quality_indicators.get("quality_score", 0.5)
+                        if quality_indicators
+                        else 0.5
+                    ),
+                }
+            )
 
         # Analyze patterns
         hour_effectiveness = defaultdict(list)
@@ -543,6 +678,8 @@ class FeedbackImprovementService:
                 avg_quality = statistics.mean([r["quality"] for r in responses])
                 best_days[day] = avg_quality
 
+        confidence = len(timing_data) / 10.0
+
         return {
             "total_questions": len(questions),
             "best_hours": dict(
@@ -551,7 +688,7 @@ class FeedbackImprovementService:
             "best_days": dict(
                 sorted(best_days.items(), key=lambda x: x[1], reverse=True)[:3]
             ),
-            "confidence_score": min(1.0, len(timing_data) / 10.0),
+            "confidence_score": confidence if confidence < 1.0 else 1.0,
         }
 
     async def _generate_timing_recommendations(
@@ -569,16 +706,7 @@ class FeedbackImprovementService:
 
         if timing_analysis["best_days"]:
             best_day = list(timing_analysis["best_days"].keys())[0]
-            day_names = [
-                "Monday",
-                "Tuesday",
-                "Wednesday",
-                "Thursday",
-                "Friday",
-                "Saturday",
-                "Sunday",
-            ]
-            recommendations.append(f"Optimal day: {day_names[best_day]}")
+            recommendations.append(f"Optimal day: {_DAY_NAMES[best_day]}")
 
         confidence = timing_analysis["confidence_score"]
         if confidence < 0.5:
@@ -596,38 +724,57 @@ class FeedbackImprovementService:
         if not interactions:
             return {"error": "No interactions to analyze"}
 
-        # Get feedback for these interactions
+        # Get feedback for these interactions; ANY(ARRAY[...]) binds the ids
+        # as a single array parameter instead of one placeholder per id
+        # Aggregate the feedback metrics in the database so only six
+        # scalars cross the wire instead of every feedback row
         interaction_ids = [i.id for i in interactions]
-        feedback = (
-            self.db.query(InteractionFeedback)
-            .filter(InteractionFeedback.question_id.in_(interaction_ids))
-            .all()
+        (
+            feedback_count,
+            avg_interaction_rating,
+            avg_rapport_rating,
+            trust_positive_changes,
+            trust_negative_changes,
+            avg_intrusion_level,
+        ) = (
+            self.db.query(
+                func.count(),
+                func.avg(InteractionFeedback.interaction_rating),
+                func.avg(InteractionFeedback.rapport_rating),
+                func.count().filter(
+                    InteractionFeedback.trust_change == _TRUST_INCREASED
+                ),
+                func.count().filter(
+                    InteractionFeedback.trust_change == _TRUST_DECREASED
+                ),
+                func.avg(InteractionFeedback.intrusion_level),
+            )
+            .filter(InteractionFeedback.question_id == any_(interaction_ids))
+            .one()
         )
 
         trust_metrics = {
             "response_rate": member.response_rate,
             "avg_response_time": member.avg_response_time,
             "interaction_count": len(interactions),
-            "feedback_count": len(feedback),
+            "feedback_count": feedback_count,
         }
 
-        if feedback:
+        if feedback_count:
             trust_metrics.update(
                 {
-                    "avg_interaction_rating": statistics.mean(
-                        [f.interaction_rating for f in feedback]
-                    ),
-                    "avg_rapport_rating": statistics.mean(
-                        [f.rapport_rating for f in feedback if f.rapport_rating]
-                    ),
-                    "trust_positive_changes": len(
-                        [f for f in feedback if f.trust_change == "increased"]
-                    ),
-                    "trust_negative_changes": len(
-                        [f for f in feedback if f.trust_change == "decreased"]
+                    "avg_interaction_rating": float(avg_interaction_rating),
+                    "avg_rapport_rating": (
+                        float(avg_rapport_rating)
+                        if avg_rapport_rating is not None
+                        else None
                     ),
-                    "avg_intrusion_level": statistics.mean(
-                        [f.intrusion_level for f in feedback if f.intrusion_level]
+                    "trust_positive_changes": trust_positive_changes,
+                    "trust_negative_changes": trust_negative_changes,
+                    "avg_intrusion_level": (
+                        float(avg_intrusion_level)
+                        if avg_intrusion_level is not None
+                        else None
                     ),
                 }
             )
@@ -642,20 +789,27 @@ class FeedbackImprovementService:
         positive_factors = []
         negative_factors = []
 
+        # One query fetches the earliest response per question instead of
+        # lazy-loading every interaction's response collection
+        interaction_ids = [i.id for i in interactions]
+        first_response = self._first_response_subquery(interaction_ids)
+        first_response_times = self.db.execute(
+            select(first_response.c.response_time_seconds).filter(
+                first_response.c.rn == 1
+            )
+        ).all()
+
         # Analyze response patterns
-        response_count = sum(1 for i in interactions if i.responses)
+        response_count = len(first_response_times)
         if response_count / len(interactions) > 0.8:
             positive_factors.append("High response rate")
         elif response_count / len(interactions) < 0.3:
             negative_factors.append("Low response rate")
 
         # Analyze timing patterns
-        avg_response_times = []
-        for interaction in interactions:
-            if interaction.responses:
-                response = interaction.responses[0]
-                if response.response_time_seconds:
-                    avg_response_times.append(response.response_time_seconds)
+        avg_response_times = [
+            seconds for (seconds,) in first_response_times if seconds
+        ]
 
         if avg_response_times:
             avg_time_hours = statistics.mean(avg_response_times) / 3600
@@ -685,10 +839,10 @@ class FeedbackImprovementService:
         fatigue_indicators = []
         fatigue_score = 0.0
 
-        # Check frequency increase
+        # Check frequency increase (integer week keys avoid per-row strftime)
         questions_by_week = defaultdict(int)
         for question in questions:
-            week = question.created_at.strftime("%Y-W%U")
+            week = question.created_at.toordinal() // 7
             questions_by_week[week] += 1
 
         weekly_counts = list(questions_by_week.values())
@@ -707,7 +861,7 @@ class FeedbackImprovementService:
         # Check response rate decline
         responses_by_week = defaultdict(list)
         for question in questions:
-            week = question.created_at.strftime("%Y-W%U")
+            week = question.created_at.toordinal() // 7
             responses_by_week[week].append(1 if question.responses else 0)
 
         weekly_response_rates = []
@@ -726,22 +880,24 @@ class FeedbackImprovementService:
                 fatigue_indicators.append("Declining response rate")
                 fatigue_score += 0.4
 
-        # Check for feedback about frequency
-        feedback = (
-            self.db.query(InteractionFeedback)
-            .filter(InteractionFeedback.question_id.in_([q.id for q in questions]))
-            .all()
+        # Check for feedback about frequency; two filtered counts come back
+        # as scalars instead of transferring every feedback row
+        question_ids = [q.id for q in questions]
+        total_feedback, high_intrusion_count = (
+            self.db.query(
+                func.count(),
+                func.count().filter(InteractionFeedback.intrusion_level >= 4),
+            )
+            .filter(InteractionFeedback.question_id == any_(question_ids))
+            .one()
         )
 
-        high_intrusion_feedback = [
-            f for f in feedback if f.intrusion_level and f.intrusion_level >= 4
-        ]
-        if len(high_intrusion_feedback) > len(feedback) * 0.3:
+        if high_intrusion_count > total_feedback * 0.3:
             fatigue_indicators.append("High intrusion ratings")
             fatigue_score += 0.3
 
         fatigue_detected = fatigue_score > 0.5
-        fatigue_level = min(1.0, fatigue_score)
+        fatigue_level = fatigue_score if fatigue_score < 1.0 else 1.0
 
         return {
             "fatigue_detected": fatigue_detected,
@@ -786,9 +942,10 @@ class FeedbackImprovementService:
         avg_quality = statistics.mean(quality_scores) if quality_scores else 0.5
 
         # Feedback metrics
+        question_ids = [q.id for q in questions]
         feedback = (
             self.db.query(InteractionFeedback)
-            .filter(InteractionFeedback.question_id.in_([q.id for q in questions]))
+            .filter(InteractionFeedback.question_id == any_(question_ids))
             .all()
         )
 
@@ -864,17 +1021,23 @@ class FeedbackImprovementService:
         """
 
         try:
-            suggestions_text = await self.llm_service.generate_text(
-                prompt=suggestion_prompt, max_tokens=200
+            # Only three short lines are kept, so cap generation accordingly
+            suggestions_text = await llm_cache.generate_text(
+                self.llm_service, prompt=suggestion_prompt, max_tokens=150
             )
 
-            # Parse suggestions (simple line-based parsing)
-            suggestions = [
-                s.strip()
-                for s in suggestions_text.split("\n")
-                if s.strip() and not s.startswith("-")
-            ]
-            return suggestions[:3]  # Return top 3
+            # Parse suggestions lazily (simple line-based parsing) and stop
+            # after the top 3 instead of materializing every line
+            return list(
+                islice(
+                    (
+                        s.strip()
+                        for s in suggestions_text.splitlines()
+                        if s.strip() and not s.startswith("-")
+                    ),
+                    3,
+                )
+            )
         except Exception:
             return [
                 "Review template wording for clarity",
@@ -884,21 +1047,12 @@ class FeedbackImprovementService:
     def _calculate_improvement_priority(self, performance: Dict[str, Any]) -> float:
         """Calculate priority score for template improvement"""
 
-        priority = 0.0
-
-        # High usage but poor performance = high priority
-        if performance["usage_count"] > 10:
-            priority += 0.3
-
-        # Poor metrics = higher priority
-        if performance["response_rate"] < 0.5:
-            priority += 0.4
-        if performance["avg_quality"] < 0.5:
-            priority += 0.3
-        if performance["avg_rating"] < 2.5:
-            priority += 0.5
-
-        return min(1.0, priority)
+        return _improvement_priority_kernel(
+            performance["usage_count"],
+            performance["response_rate"],
+            performance["avg_quality"],
+            performance["avg_rating"],
+        )
 
     # Additional analysis methods for comprehensive reporting
     async def _analyze_feedback_summary(
@@ -906,25 +1060,44 @@ class FeedbackImprovementService:
     ) -> Dict[str, Any]:
         """Analyze overall feedback summary"""
 
-        if not feedback_data:
+        # One pass pulls the attributes into columnar arrays; the statistics
+        # themselves are vectorized instead of separate Python loops
+        ratings = []
+        relevance = []
+        clarity = []
+        trust_changes = []
+
+        for f in feedback_data:
+            ratings.append(f.interaction_rating)
+            relevance.append(f.question_relevance if f.question_relevance else np.nan)
+            clarity.append(f.question_clarity if f.question_clarity else np.nan)
+            trust_changes.append(f.trust_change)
+
+        if not ratings:
             return {}
 
+        relevance_arr = np.asarray(relevance, dtype=np.float64)
+        clarity_arr = np.asarray(clarity, dtype=np.float64)
+        trust_arr = np.asarray(trust_changes, dtype=object)
+
         return {
-            "total_feedback": len(feedback_data),
-            "avg_interaction_rating": statistics.mean(
-                [f.interaction_rating for f in feedback_data]
-            ),
-            "avg_relevance": statistics.mean(
-                [f.question_relevance for f in feedback_data if f.question_relevance]
+            "total_feedback": len(ratings),
+            "avg_interaction_rating": float(np.mean(ratings)),
+            "avg_relevance": (
+                float(np.nanmean(relevance_arr))
+                if not np.isnan(relevance_arr).all()
+                else 0.0
             ),
-            "avg_clarity": statistics.mean(
-                [f.question_clarity for f in feedback_data if f.question_clarity]
+            "avg_clarity": (
+                float(np.nanmean(clarity_arr))
+                if not np.isnan(clarity_arr).all()
+                else 0.0
             ),
-            "positive_trust_changes": len(
-                [f for f in feedback_data if f.trust_change == "increased"]
+            "positive_trust_changes": int(
+                np.count_nonzero(trust_arr == _TRUST_INCREASED)
             ),
-            "negative_trust_changes": len(
-                [f for f in feedback_data if f.trust_change == "decreased"]
+            "negative_trust_changes": int(
+                np.count_nonzero(trust_arr == _TRUST_DECREASED)
             ),
         }
 
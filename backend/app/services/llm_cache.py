@@ -0,0 +1,155 @@
+"""
+LLM Response Cache
+
+Caches deterministic LLM completions (template customization, reasoning,
+improvement suggestions) keyed by a hash of the prompt and generation
+parameters. Identical prompts recur across batch runs and retries, and a
+cache hit skips the provider round trip entirely.
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import time
+from typing import Dict, Optional, Protocol, Tuple
+
+DEFAULT_TTL_SECONDS = 86400  # 24 hours
+
+# Generation fan-out guard rails: bounded concurrency per process plus
+# exponential backoff on transient provider failures
+GENERATION_CONCURRENCY = 10
+MAX_ATTEMPTS = 3
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 10.0
+
+def _is_retryable(exc: Exception) -> bool:
+    """Whether a generation failure is worth retrying
+
+    Provider SDKs raise differently named rate-limit errors, so those are
+    matched by class name rather than by import.
+    """
+
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return True
+    return "ratelimit" in type(exc).__name__.lower()
+
+class CacheBackend(Protocol):
+    """Storage backend for cached LLM responses"""
+
+    async def get(self, key: str) -> Optional[str]: ...
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None: ...
+
+class MemoryCacheBackend:
+    """In-process cache backend with per-entry TTL expiry"""
+
+    def __init__(self):
+        self._store: Dict[str, Tuple[float, str]] = {}
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() > expires_at:
+            self._store.pop(key, None)
+            return None
+
+        return value
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        self._store[key] = (time.monotonic() + ttl_seconds, value)
+
+class RedisCacheBackend:
+    """Redis-backed cache shared across workers"""
+
+    def __init__(self, client=None):
+        if client is None:
+            from ..core.database import redis_client
+
+            client = redis_client
+        self._client = client
+
+    async def get(self, key: str) -> Optional[str]:
+        return await self._client.get(key)
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        await self._client.set(key, value, ex=ttl_seconds)
+
+class LLMCache:
+    """Exact-match cache wrapping LLMService.generate_text"""
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+    ):
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.ttl_seconds = ttl_seconds
+        self.stats = {"hits": 0, "misses": 0}
+        self._semaphore = asyncio.Semaphore(GENERATION_CONCURRENCY)
+
+    @staticmethod
+    def make_key(
+        prompt: str, max_tokens: int, system_cacheable: Optional[str] = None
+    ) -> str:
+        payload = json.dumps(
+            {
+                "prompt": prompt,
+                "max_tokens": max_tokens,
+                "system_cacheable": system_cacheable,
+            },
+            sort_keys=True,
+        )
+        return "llm_cache:" + hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def generate_text(
+        self,
+        llm_service,
+        prompt: str,
+        max_tokens: int,
+        system_cacheable: Optional[str] = None,
+    ) -> str:
+        """Return a cached completion or generate and cache a new one
+
+        system_cacheable carries the static instruction scaffold so the
+        LLM layer can mark it for provider-side prompt caching.
+        """
+
+        key = self.make_key(prompt, max_tokens, system_cacheable)
+
+        cached = await self.backend.get(key)
+        if cached is not None:
+            self.stats["hits"] += 1
+            return cached
+
+        self.stats["misses"] += 1
+        kwargs = {"prompt": prompt, "max_tokens": max_tokens}
+        if system_cacheable is not None:
+            kwargs["system_cacheable"] = system_cacheable
+
+        # Cache misses go through the shared semaphore so concurrent
+        # batches stay under provider rate limits, with jittered
+        # exponential backoff on transient failures
+        async with self._semaphore:
+            for attempt in range(1, MAX_ATTEMPTS + 1):
+                try:
+                    text = await llm_service.generate_text(**kwargs)
+                    break
+                except Exception as exc:
+                    if attempt == MAX_ATTEMPTS or not _is_retryable(exc):
+                        raise
+                    delay = min(
+                        BACKOFF_MAX_SECONDS,
+                        BACKOFF_BASE_SECONDS * 2 ** (attempt - 1),
+                    )
+                    await asyncio.sleep(delay * (0.5 + random.random() / 2))
+
+        await self.backend.set(key, text, self.ttl_seconds)
+
+        return text
+
+# Shared process-wide cache for prompt-deterministic generation paths
+llm_cache = LLMCache()
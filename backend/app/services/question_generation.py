@@ -10,24 +10,266 @@ Generates contextually appropriate questions for team members based on:
 
 from typing import Any, Dict, List, Optional, Tuple
 
+import asyncio
+import json
+import logging
+import re
 from datetime import datetime, timedelta
+from functools import lru_cache
+from string import Template
 
-from sqlalchemy import and_, desc, or_
-from sqlalchemy.orm import Session
+import numpy as np
+
+from sqlalchemy import and_, cast, desc, func, or_, select, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
 from ..core.config import settings
+from ..core.database import async_session_factory
 from ..models.team_interrogation import (CommunicationStyle, GeneratedQuestion,
                                          QuestionComplexity, QuestionResponse,
                                          QuestionTemplate, QuestionType,
                                          TeamMemberProfile)
 from ..models.user import User
+from .llm_cache import llm_cache
 from .llm_service import LLMService
 from .memory_service import MemoryService
 
+logger = logging.getLogger(__name__)
+
+# Parameter-selection helpers memoized on compact keys; profiles in a batch
+# repeat the same seniority/trust/style combinations, so repeat calls become
+# a single hash lookup
+
+@lru_cache(maxsize=4096)
+def _determine_complexity_cached(
+    seniority_level: str, trust_level: str, technical_match: bool
+) -> QuestionComplexity:
+    """Resolve complexity from seniority, trust, and technical-topic match"""
+
+    # Base complexity on role and seniority
+    if seniority_level in ("senior", "lead", "principal"):
+        base_complexity = QuestionComplexity.COMPLEX
+    elif seniority_level in ("mid", "intermediate"):
+        base_complexity = QuestionComplexity.MODERATE
+    else:
+        base_complexity = QuestionComplexity.SIMPLE
+
+    # Adjust based on context
+    if technical_match:
+        return QuestionComplexity.TECHNICAL
+
+    # Consider trust level
+    if trust_level in ("low", "building"):
+        return QuestionComplexity.SIMPLE
+
+    return base_complexity
+
+@lru_cache(maxsize=4096)
+def _determine_question_type_cached(
+    preferred_style: str, requires_explanation: bool, feedback_request: bool
+) -> QuestionType:
+    """Resolve question type from style preference and context flags"""
+
+    # Consider communication preferences
+    if preferred_style == CommunicationStyle.DIRECT:
+        return QuestionType.YES_NO
+
+    # For complex topics, use open-ended
+    if requires_explanation:
+        return QuestionType.OPEN_ENDED
+
+    # For feedback, use scales
+    if feedback_request:
+        return QuestionType.SCALE
+
+    # Default to open-ended for more information
+    return QuestionType.OPEN_ENDED
+
+@lru_cache(maxsize=4096)
+def _select_delivery_channel_cached(
+    preferred_channels: Tuple[str, ...], role: str
+) -> str:
+    """Resolve delivery channel from channel preferences and role"""
+
+    if preferred_channels:
+        return preferred_channels[0]
+
+    # Default based on role
+    if role in ("developer", "engineer"):
+        return "slack"
+    elif role in ("manager", "director"):
+        return "email"
+    else:
+        return "slack"
+
+@lru_cache(maxsize=1024)
+def _expertise_pattern(expertise_areas: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """Compiled multi-pattern matcher for a profile's expertise areas
+
+    One alternation scan through the question text replaces a
+    str.__contains__ pass per expertise area; cached per unique area set.
+    """
+
+    if not expertise_areas:
+        return None
+
+    # Longest-first so overlapping areas match their most specific form;
+    # IGNORECASE keeps callers from allocating a lowered copy of the text
+    return re.compile(
+        "|".join(
+            re.escape(area)
+            for area in sorted(expertise_areas, key=len, reverse=True)
+        ),
+        re.IGNORECASE,
+    )
+
+@lru_cache(maxsize=1024)
+def _availability_array(items: Tuple[Tuple[str, float], ...]) -> np.ndarray:
+    """Hour-indexed availability vector built from the profile's JSON dict
+
+    Converting once per unique availability map lets delivery scheduling
+    index by hour instead of doing str(hour) dict lookups in a loop.
+    """
+
+    by_hour = dict(items)
+    return np.fromiter(
+        (by_hour.get(str(hour), 0.5) for hour in range(24)),
+        dtype=np.float32,
+        count=24,
+    )
+
+# Numeric scoring kernels over primitive args, extracted to module scope so
+# batch paths skip per-call attribute and dict lookups
+
+def _priority_kernel(
+    is_senior: bool, high_trust: bool, urgent: bool, recently_active: bool
+) -> float:
+    """Score question priority from pre-resolved profile/context flags"""
+
+    priority = 0.5  # Base priority
+
+    # Increase priority for senior roles
+    if is_senior:
+        priority += 0.2
+
+    # Increase for high-trust members
+    if high_trust:
+        priority += 0.1
+
+    # Increase for urgent context
+    if urgent:
+        priority += 0.3
+
+    # Decrease for recent interactions
+    if recently_active:
+        priority -= 0.1
+
+    if priority < 0.0:
+        return 0.0
+    return priority if priority < 1.0 else 1.0
+
+def _quality_kernel(
+    response_rate: float, high_trust: bool, relevant_expertise: bool
+) -> float:
+    """Predict response quality from pre-resolved profile flags"""
+
+    score = 0.5
+
+    # Increase for experienced members
+    if response_rate > 0.8:
+        score += 0.2
+
+    # Increase for high trust
+    if high_trust:
+        score += 0.1
+
+    # Increase for relevant expertise
+    if relevant_expertise:
+        score += 0.2
+
+    return score if score < 1.0 else 1.0
+
+# Static instruction scaffolds, kept separate from the per-call variable
+# tail so the provider can cache them (cache_control "ephemeral") and bill
+# repeat batch calls at the cached-prompt rate
+_CUSTOMIZE_TEMPLATE_SCAFFOLD = """
+You customize question templates for individual team members.
+
+Given a question template, the team member's profile, the current context,
+and template variables, generate a natural, personalized question that
+maintains the template's intent but feels customized for this specific
+person and context. Respond with only the question text.
+"""
+
+_CUSTOM_QUESTION_SCAFFOLD = """
+You generate questions for team members based on their profile and context.
+
+The question should:
+1. Be appropriate for their role and expertise level
+2. Match their communication style preference
+3. Be relevant to the current context
+4. Encourage honest and detailed responses
+5. Build trust and rapport
+
+Generate only the question text, nothing else.
+"""
+
+# Pre-parsed variable tails for the prompts above; Template.substitute
+# avoids re-parsing the multi-line literal per call, and contexts are
+# serialized compactly (no indent) since the LLM does not need pretty print
+_CUSTOMIZE_TAIL = Template(
+    """
+        Template: $template_text
+
+        Team Member Info:
+        - Role: $role
+        - Seniority: $seniority
+        - Preferred Style: $style
+        - Expertise: $expertise
+
+        Context: $context
+
+        Variables: $variables
+        """
+)
+
+_CUSTOM_QUESTION_TAIL = Template(
+    """
+        Generate a $complexity $question_type question for a team member with the following profile:
+
+        Team Member:
+        - Role: $role
+        - Seniority: $seniority
+        - Communication Style: $style
+        - Expertise Areas: $expertise
+        - Trust Level: $trust_level
+
+        Context: $context
+        """
+)
+
+_REASONING_TMPL = Template(
+    """
+        Explain why this question was generated for this team member:
+
+        Question: $question_text
+
+        Team Member:
+        - Role: $role
+        - Expertise: $expertise
+
+        Context: $context
+
+        Provide a brief explanation of the reasoning (1-2 sentences).
+        """
+)
+
 class QuestionGenerationService:
     """Service for intelligent question generation and management"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.llm_service = LLMService()
         self.memory_service = MemoryService(db)
@@ -42,11 +284,12 @@ class QuestionGenerationService:
         """Generate a contextually appropriate question for a team member"""
 
         # Get team member profile
-        profile = (
-            self.db.query(TeamMemberProfile)
-            .filter(TeamMemberProfile.id == recipient_id)
-            .first()
+        result = await self.db.execute(
+            select(TeamMemberProfile)
+            .options(joinedload(TeamMemberProfile.user))
+            .where(TeamMemberProfile.id == recipient_id)
         )
+        profile = result.scalar_one_or_none()
 
         if not profile:
             raise ValueError(f"Team member profile not found: {recipient_id}")
@@ -58,13 +301,25 @@ class QuestionGenerationService:
         # Find suitable template or generate custom question
         template = await self._find_best_template(profile, complexity, q_type, context)
 
+        # Joined once here; every prompt for this member reuses it
+        expertise = ", ".join(profile.expertise_areas)
+
         if template:
-            question_text = await self._customize_template(template, profile, context)
+            question_text = await self._customize_template(
+                template, profile, context, expertise
+            )
         else:
             question_text = await self._generate_custom_question(
-                profile, complexity, q_type, context
+                profile, complexity, q_type, context, expertise
             )
 
+        # Reasoning and quality prediction only need the final question
+        # text, so overlap them instead of paying two sequential awaits
+        reasoning, quality_score = await asyncio.gather(
+            self._generate_reasoning(profile, context, question_text, expertise),
+            self._predict_quality_score(profile, question_text, context),
+        )
+
         # Create question record
         question = GeneratedQuestion(
             template_id=template.id if template else None,
@@ -73,24 +328,28 @@ class QuestionGenerationService:
             question_type=q_type,
             complexity=complexity,
             context=context,
-            reasoning=await self._generate_reasoning(profile, context, question_text),
+            reasoning=reasoning,
             priority=self._calculate_priority(profile, context),
             delivery_channel=self._select_delivery_channel(profile),
             scheduled_for=self._calculate_delivery_time(profile),
             expires_at=self._calculate_expiry_time(profile),
-            quality_score=await self._predict_quality_score(
-                profile, question_text, context
-            ),
+            quality_score=quality_score,
         )
 
         self.db.add(question)
-        self.db.commit()
-        self.db.refresh(question)
 
-        # Update template usage if used
+        # Bump template usage atomically inside the same transaction; the
+        # SQL-side increment avoids a second commit and the lost-update
+        # race between concurrent generations sharing a template
         if template:
-            template.usage_count += 1
-            self.db.commit()
+            await self.db.execute(
+                update(QuestionTemplate)
+                .where(QuestionTemplate.id == template.id)
+                .values(usage_count=QuestionTemplate.usage_count + 1)
+            )
+
+        await self.db.commit()
+        await self.db.refresh(question)
 
         return question
 
@@ -99,11 +358,12 @@ class QuestionGenerationService:
     ) -> Optional[GeneratedQuestion]:
         """Generate follow-up question based on previous response"""
 
-        parent_question = (
-            self.db.query(GeneratedQuestion)
-            .filter(GeneratedQuestion.id == parent_question_id)
-            .first()
+        result = await self.db.execute(
+            select(GeneratedQuestion).where(
+                GeneratedQuestion.id == parent_question_id
+            )
         )
+        parent_question = result.scalar_one_or_none()
 
         if not parent_question:
             return None
@@ -135,7 +395,7 @@ class QuestionGenerationService:
         follow_up.parent_question_id = parent_question_id
         follow_up.follow_up_trigger = "response_analysis"
 
-        self.db.commit()
+        await self.db.commit()
 
         return follow_up
 
@@ -144,26 +404,71 @@ class QuestionGenerationService:
     ) -> List[GeneratedQuestion]:
         """Generate questions for multiple team members"""
 
-        # Get team member profiles
-        profiles = (
-            self.db.query(TeamMemberProfile)
-            .filter(TeamMemberProfile.team_id == team_id)
-            .all()
+        # Get team member profiles with their users eager-loaded so template
+        # customization never lazy-loads profile.user per member
+        result = await self.db.execute(
+            select(TeamMemberProfile)
+            .options(joinedload(TeamMemberProfile.user))
+            .where(TeamMemberProfile.team_id == team_id)
         )
+        profiles = result.scalars().all()
 
-        questions = []
+        candidates = profiles[:max_questions]
 
-        for profile in profiles[:max_questions]:
-            # Check if member should receive question
-            if await self._should_question_member(profile, context):
-                try:
-                    question = await self.generate_question_for_member(
+        # One grouped count replaces the per-member COUNT(*) round trip
+        # inside _should_question_member
+        count_result = await self.db.execute(
+            select(GeneratedQuestion.recipient_id, func.count())
+            .where(
+                GeneratedQuestion.recipient_id.in_([p.id for p in candidates]),
+                GeneratedQuestion.created_at > datetime.utcnow() - timedelta(days=7),
+            )
+            .group_by(GeneratedQuestion.recipient_id)
+        )
+        recent_counts = dict(count_result.all())
+
+        # Generate concurrently so members overlap their LLM round trips;
+        # the semaphore keeps us under provider rate limits
+        semaphore = asyncio.Semaphore(10)
+
+        async def _generate_for(profile: TeamMemberProfile):
+            async with semaphore:
+                # Check if member should receive question
+                if not await self._should_question_member(
+                    profile, context, recent_counts.get(profile.id, 0)
+                ):
+                    return None
+                # AsyncSession is not safe for concurrent use across
+                # tasks, so each worker generates and commits on its own
+                # session; the shared parent session is never touched
+                # while workers overlap their LLM round trips
+                async with async_session_factory() as session:
+                    worker = QuestionGenerationService(session)
+                    return await worker.generate_question_for_member(
                         recipient_id=profile.id, context=context
                     )
-                    questions.append(question)
-                except Exception as e:
-                    # Log error but continue with other members
-                    print(f"Error generating question for {profile.id}: {e}")
+
+        results = await asyncio.gather(
+            *[_generate_for(profile) for profile in candidates],
+            return_exceptions=True,
+        )
+
+        questions = []
+        for profile, result in zip(candidates, results):
+            if isinstance(result, GeneratedQuestion):
+                questions.append(result)
+            elif isinstance(result, Exception):
+                # Expected operational failures are logged and the batch
+                # continues; anything else is a bug and should surface
+                if not isinstance(
+                    result, (ValueError, TimeoutError, ConnectionError)
+                ):
+                    raise result
+                logger.warning(
+                    "Question generation failed for member %s: %s",
+                    profile.id,
+                    result,
+                )
 
         return questions
 
@@ -196,58 +501,51 @@ class QuestionGenerationService:
         )
 
         self.db.add(template)
-        self.db.commit()
-        self.db.refresh(template)
+        await self.db.commit()
+        await self.db.refresh(template)
 
         return template
 
     async def optimize_question_effectiveness(self, template_id: str) -> None:
         """Optimize question template based on response effectiveness"""
 
-        template = (
-            self.db.query(QuestionTemplate)
-            .filter(QuestionTemplate.id == template_id)
-            .first()
-        )
-
-        if not template:
-            return
-
-        # Get questions using this template
-        questions = (
-            self.db.query(GeneratedQuestion)
-            .filter(GeneratedQuestion.template_id == template_id)
-            .all()
+        # Aggregate quality and completion rate in the database; loading
+        # every question and response just to average two numbers pulled
+        # thousands of ORM objects for high-usage templates
+        result = await self.db.execute(
+            select(
+                func.count().label("total_responses"),
+                func.avg(
+                    QuestionResponse.quality_indicators["quality_score"].as_float()
+                ).label("avg_quality"),
+                func.count().filter(QuestionResponse.status == "completed").label(
+                    "completed"
+                ),
+            )
+            .select_from(QuestionResponse)
+            .join(
+                GeneratedQuestion,
+                QuestionResponse.question_id == GeneratedQuestion.id,
+            )
+            .where(GeneratedQuestion.template_id == template_id)
         )
+        row = result.one()
 
-        if not questions:
+        if not row.total_responses:
             return
 
-        # Calculate effectiveness metrics
-        total_responses = 0
-        quality_sum = 0.0
-        response_rate = 0.0
-
-        for question in questions:
-            responses = question.responses
-            if responses:
-                total_responses += len(responses)
-                quality_sum += sum(
-                    r.quality_indicators.get("quality_score", 0.0) for r in responses
-                )
-                response_rate += len(
-                    [r for r in responses if r.status == "completed"]
-                ) / len(responses)
-
-        if total_responses > 0:
-            avg_quality = quality_sum / total_responses
-            avg_response_rate = response_rate / len(questions)
+        avg_quality = row.avg_quality or 0.0
+        response_rate = row.completed / row.total_responses
 
-            # Update template effectiveness
-            template.effectiveness_score = (avg_quality * 0.6) + (
-                avg_response_rate * 0.4
+        # Update template effectiveness without materializing the template
+        await self.db.execute(
+            update(QuestionTemplate)
+            .where(QuestionTemplate.id == template_id)
+            .values(
+                effectiveness_score=(avg_quality * 0.6) + (response_rate * 0.4)
             )
-            self.db.commit()
+        )
+        await self.db.commit()
 
     # Private helper methods
 
@@ -256,44 +554,23 @@ class QuestionGenerationService:
     ) -> QuestionComplexity:
         """Determine appropriate complexity level for the team member"""
 
-        # Base complexity on role and seniority
-        if profile.seniority_level in ["senior", "lead", "principal"]:
-            base_complexity = QuestionComplexity.COMPLEX
-        elif profile.seniority_level in ["mid", "intermediate"]:
-            base_complexity = QuestionComplexity.MODERATE
-        else:
-            base_complexity = QuestionComplexity.SIMPLE
-
-        # Adjust based on context
-        if context.get("technical_topic", False):
-            if "technical" in profile.expertise_areas:
-                return QuestionComplexity.TECHNICAL
-
-        # Consider trust level
-        if profile.trust_level in ["low", "building"]:
-            return QuestionComplexity.SIMPLE
-
-        return base_complexity
+        return _determine_complexity_cached(
+            profile.seniority_level,
+            profile.trust_level,
+            bool(context.get("technical_topic", False))
+            and "technical" in profile.expertise_areas,
+        )
 
     def _determine_question_type(
         self, profile: TeamMemberProfile, context: Dict[str, Any]
     ) -> QuestionType:
         """Determine appropriate question type"""
 
-        # Consider communication preferences
-        if profile.preferred_style == CommunicationStyle.DIRECT:
-            return QuestionType.YES_NO
-
-        # For complex topics, use open-ended
-        if context.get("requires_explanation", False):
-            return QuestionType.OPEN_ENDED
-
-        # For feedback, use scales
-        if context.get("feedback_request", False):
-            return QuestionType.SCALE
-
-        # Default to open-ended for more information
-        return QuestionType.OPEN_ENDED
+        return _determine_question_type_cached(
+            profile.preferred_style,
+            bool(context.get("requires_explanation", False)),
+            bool(context.get("feedback_request", False)),
+        )
 
     async def _find_best_template(
         self,
@@ -305,7 +582,7 @@ class QuestionGenerationService:
         """Find the best matching template for the context"""
 
         # Query templates matching basic criteria
-        query = self.db.query(QuestionTemplate).filter(
+        query = select(QuestionTemplate).where(
             and_(
                 QuestionTemplate.question_type == question_type,
                 QuestionTemplate.complexity == complexity,
@@ -313,26 +590,25 @@ class QuestionGenerationService:
             )
         )
 
-        # Filter by role if specified
+        # Filter by role if specified; jsonb containment (@>) can use the
+        # GIN index on target_roles instead of scanning every template
         if profile.role:
-            query = query.filter(QuestionTemplate.target_roles.contains([profile.role]))
+            query = query.where(
+                cast(QuestionTemplate.target_roles, JSONB).contains([profile.role])
+            )
 
-        # Order by effectiveness score
-        templates = (
-            query.order_by(desc(QuestionTemplate.effectiveness_score)).limit(5).all()
+        # Let the database rank and return only the most effective template
+        result = await self.db.execute(
+            query.order_by(desc(QuestionTemplate.effectiveness_score)).limit(1)
         )
-
-        if not templates:
-            return None
-
-        # Use the most effective template
-        return templates[0]
+        return result.scalars().first()
 
     async def _customize_template(
         self,
         template: QuestionTemplate,
         profile: TeamMemberProfile,
         context: Dict[str, Any],
+        expertise: str,
     ) -> str:
         """Customize template with specific context and profile information"""
 
@@ -345,27 +621,23 @@ class QuestionGenerationService:
             **template.variables,
         }
 
-        # Use LLM to customize the template
-        customization_prompt = f"""
-        Customize this question template for a team member:
-
-        Template: {template.template_text}
-
-        Team Member Info:
-        - Role: {profile.role}
-        - Seniority: {profile.seniority_level}
-        - Preferred Style: {profile.preferred_style}
-        - Expertise: {', '.join(profile.expertise_areas)}
-
-        Context: {json.dumps(context, indent=2)}
-
-        Variables: {json.dumps(variables, indent=2)}
-
-        Generate a natural, personalized question that maintains the template's intent but feels customized for this specific person and context.
-        """
+        # Use LLM to customize the template; only the variable tail is sent
+        # per call, the scaffold rides in the provider-cached block
+        customization_prompt = _CUSTOMIZE_TAIL.substitute(
+            template_text=template.template_text,
+            role=profile.role,
+            seniority=profile.seniority_level,
+            style=profile.preferred_style,
+            expertise=expertise,
+            context=json.dumps(context, sort_keys=True),
+            variables=json.dumps(variables, sort_keys=True, default=str),
+        )
 
-        customized_text = await self.llm_service.generate_text(
-            prompt=customization_prompt, max_tokens=200
+        customized_text = await llm_cache.generate_text(
+            self.llm_service,
+            prompt=customization_prompt,
+            max_tokens=200,
+            system_cacheable=_CUSTOMIZE_TEMPLATE_SCAFFOLD,
         )
 
         return customized_text.strip()
@@ -376,58 +648,48 @@ class QuestionGenerationService:
         complexity: QuestionComplexity,
         question_type: QuestionType,
         context: Dict[str, Any],
+        expertise: str,
     ) -> str:
         """Generate a completely custom question"""
 
-        generation_prompt = f"""
-        Generate a {complexity.value} {question_type.value} question for a team member with the following profile:
-
-        Team Member:
-        - Role: {profile.role}
-        - Seniority: {profile.seniority_level}
-        - Communication Style: {profile.preferred_style}
-        - Expertise Areas: {', '.join(profile.expertise_areas)}
-        - Trust Level: {profile.trust_level}
-
-        Context: {json.dumps(context, indent=2)}
-
-        The question should:
-        1. Be appropriate for their role and expertise level
-        2. Match their communication style preference
-        3. Be relevant to the current context
-        4. Encourage honest and detailed responses
-        5. Build trust and rapport
-
-        Generate only the question text, nothing else.
-        """
+        generation_prompt = _CUSTOM_QUESTION_TAIL.substitute(
+            complexity=complexity.value,
+            question_type=question_type.value,
+            role=profile.role,
+            seniority=profile.seniority_level,
+            style=profile.preferred_style,
+            expertise=expertise,
+            trust_level=profile.trust_level,
+            context=json.dumps(context, sort_keys=True),
+        )
 
-        question_text = await self.llm_service.generate_text(
-            prompt=generation_prompt, max_tokens=150
+        question_text = await llm_cache.generate_text(
+            self.llm_service,
+            prompt=generation_prompt,
+            max_tokens=150,
+            system_cacheable=_CUSTOM_QUESTION_SCAFFOLD,
         )
 
         return question_text.strip()
 
     async def _generate_reasoning(
-        self, profile: TeamMemberProfile, context: Dict[str, Any], question_text: str
+        self,
+        profile: TeamMemberProfile,
+        context: Dict[str, Any],
+        question_text: str,
+        expertise: str,
     ) -> str:
         """Generate reasoning for why this question was asked"""
 
-        reasoning_prompt = f"""
-        Explain why this question was generated for this team member:
-
-        Question: {question_text}
-
-        Team Member:
-        - Role: {profile.role}
-        - Expertise: {', '.join(profile.expertise_areas)}
-
-        Context: {json.dumps(context, indent=2)}
-
-        Provide a brief explanation of the reasoning (1-2 sentences).
-        """
+        reasoning_prompt = _REASONING_TMPL.substitute(
+            question_text=question_text,
+            role=profile.role,
+            expertise=expertise,
+            context=json.dumps(context, sort_keys=True),
+        )
 
-        reasoning = await self.llm_service.generate_text(
-            prompt=reasoning_prompt, max_tokens=100
+        reasoning = await llm_cache.generate_text(
+            self.llm_service, prompt=reasoning_prompt, max_tokens=100
         )
 
         return reasoning.strip()
@@ -437,39 +699,19 @@ class QuestionGenerationService:
     ) -> float:
         """Calculate question priority score"""
 
-        priority = 0.5  # Base priority
-
-        # Increase priority for senior roles
-        if profile.seniority_level in ["senior", "lead", "principal"]:
-            priority += 0.2
-
-        # Increase for high-trust members
-        if profile.trust_level in ["high", "excellent"]:
-            priority += 0.1
-
-        # Increase for urgent context
-        if context.get("urgency", "normal") == "high":
-            priority += 0.3
-
-        # Decrease for recent interactions
-        if profile.total_questions_received > 5:  # Recent activity
-            priority -= 0.1
-
-        return min(1.0, max(0.0, priority))
+        return _priority_kernel(
+            is_senior=profile.seniority_level in ["senior", "lead", "principal"],
+            high_trust=profile.trust_level in ["high", "excellent"],
+            urgent=context.get("urgency", "normal") == "high",
+            recently_active=profile.total_questions_received > 5,
+        )
 
     def _select_delivery_channel(self, profile: TeamMemberProfile) -> str:
         """Select the best delivery channel for the team member"""
 
-        if profile.preferred_channels:
-            return profile.preferred_channels[0]
-
-        # Default based on role
-        if profile.role in ["developer", "engineer"]:
-            return "slack"
-        elif profile.role in ["manager", "director"]:
-            return "email"
-        else:
-            return "slack"
+        return _select_delivery_channel_cached(
+            tuple(profile.preferred_channels or ()), profile.role
+        )
 
     def _calculate_delivery_time(self, profile: TeamMemberProfile) -> datetime:
         """Calculate optimal delivery time"""
@@ -482,16 +724,19 @@ class QuestionGenerationService:
             # Delay for high workload
             return base_time + timedelta(hours=4)
 
-        # Consider typical availability
-        current_hour = datetime.utcnow().hour
-        availability = profile.typical_availability.get(str(current_hour), 0.5)
+        # Consider typical availability via the cached hour-indexed vector
+        avail = _availability_array(
+            tuple(sorted((profile.typical_availability or {}).items()))
+        )
+        current_hour = base_time.hour
 
-        if availability < 0.3:
-            # Find next available hour
-            for hour_offset in range(1, 12):
-                check_hour = (current_hour + hour_offset) % 24
-                if profile.typical_availability.get(str(check_hour), 0.5) > 0.5:
-                    return base_time + timedelta(hours=hour_offset)
+        if avail[current_hour] < 0.3:
+            # Find next available hour in one vectorized scan, over the
+            # same 1-11 hour window the original loop searched
+            offsets = np.arange(1, 12)
+            open_slots = np.nonzero(avail[(current_hour + offsets) % 24] > 0.5)[0]
+            if open_slots.size:
+                return base_time + timedelta(hours=int(offsets[open_slots[0]]))
 
         return base_time
 
@@ -512,24 +757,14 @@ class QuestionGenerationService:
         """Predict the quality score for this question"""
 
         # Simple heuristic-based prediction
-        score = 0.5
-
-        # Increase for experienced members
-        if profile.response_rate > 0.8:
-            score += 0.2
+        pattern = _expertise_pattern(tuple(profile.expertise_areas or ()))
+        relevant_expertise = bool(pattern and pattern.search(question_text))
 
-        # Increase for high trust
-        if profile.trust_level in ["high", "excellent"]:
-            score += 0.1
-
-        # Increase for relevant expertise
-        relevant_expertise = any(
-            area in question_text.lower() for area in profile.expertise_areas
+        return _quality_kernel(
+            response_rate=profile.response_rate,
+            high_trust=profile.trust_level in ["high", "excellent"],
+            relevant_expertise=relevant_expertise,
         )
-        if relevant_expertise:
-            score += 0.2
-
-        return min(1.0, score)
 
     async def _analyze_follow_up_need(
         self, question: GeneratedQuestion, response: QuestionResponse
@@ -559,34 +794,15 @@ class QuestionGenerationService:
         return False
 
     async def _should_question_member(
-        self, profile: TeamMemberProfile, context: Dict[str, Any]
+        self,
+        profile: TeamMemberProfile,
+        context: Dict[str, Any],
+        recent_questions: Optional[int] = None,
     ) -> bool:
         """Determine if a team member should receive a question"""
 
-        # Check recent interaction frequency
-        recent_questions = (
-            self.db.query(GeneratedQuestion)
-            .filter(
-                and_(
-                    GeneratedQuestion.recipient_id == profile.id,
-                    GeneratedQuestion.created_at
-                    > datetime.utcnow() - timedelta(days=7),
-                )
-            )
-            .count()
-        )
-
-        # Limit frequency based on trust level
-        max_weekly_questions = {
-            "low": 1,
-            "building": 2,
-            "moderate": 3,
-            "high": 5,
-            "excellent": 7,
-        }.get(profile.trust_level, 2)
-
-        if recent_questions >= max_weekly_questions:
-            return False
+        # Cheap in-memory disqualifiers first so trivially rejected members
+        # never cost a COUNT(*) round trip
 
         # Check workload
         if profile.current_workload > 0.9:
@@ -599,4 +815,29 @@ class QuestionGenerationService:
         ):
             return False
 
-        return True
+        # Check recent interaction frequency; batch callers pass the count
+        # from a single grouped query instead of one COUNT(*) per member
+        if recent_questions is None:
+            result = await self.db.execute(
+                select(func.count())
+                .select_from(GeneratedQuestion)
+                .where(
+                    and_(
+                        GeneratedQuestion.recipient_id == profile.id,
+                        GeneratedQuestion.created_at
+                        > datetime.utcnow() - timedelta(days=7),
+                    )
+                )
+            )
+            recent_questions = result.scalar_one()
+
+        # Limit frequency based on trust level
+        max_weekly_questions = {
+            "low": 1,
+            "building": 2,
+            "moderate": 3,
+            "high": 5,
+            "excellent": 7,
+        }.get(profile.trust_level, 2)
+
+        return recent_questions < max_weekly_questions
@@ -10,16 +10,27 @@ Handles multi-channel response collection and tracking including:
 - Response validation and quality checking
 """
 
-from typing import Any, Dict, List, Optional, Tuple
-
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import asyncio
+import hashlib
+import inspect
+import json
+import logging
+import re
+import time
 import uuid
+from collections import deque
 from datetime import datetime, timedelta
+from functools import lru_cache
 
-from celery import Celery
+from celery import group
 from sqlalchemy import and_, desc, func, or_
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from ..core.config import settings
+from ..core.database import redis_client
+from ..tasks.celery_app import celery_app
 from ..models.team_interrogation import (GeneratedQuestion,
                                          InteractionFeedback, QuestionResponse,
                                          QuestionType, ResponseStatus,
@@ -30,11 +41,416 @@ from .email_service import EmailService
 from .llm_service import LLMService
 from .slack_service import SlackService
 
+logger = logging.getLogger(__name__)
+
+# Quality analyses for identical (question, response) pairs repeat across
+# reminders and duplicate submissions; cache them for a day
+QUALITY_CACHE_TTL_SECONDS = 86400
+
+# Plausibly numeric free text; gates float() so common numeric responses
+# skip exception setup and teardown. float() accepts more spellings
+# ("+4", ".5", "1e2"), so a non-match still falls back to parsing.
+_NUM_RE = re.compile(r"^-?\d+(\.\d+)?$")
+
+def _parse_scale_value(text: str) -> Optional[float]:
+    """Parse a numeric scale value from free text, None if non-numeric"""
+
+    if _NUM_RE.match(text):
+        return float(text)
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+def _completion_from(text: Optional[str], question_type: QuestionType) -> float:
+    """How complete a partial response is, from its text and question type
+
+    Pure helper so resumption-context building computes the percentage
+    once instead of re-reading and re-stripping the response per metric.
+    """
+
+    if not text:
+        return 0.0
+
+    if question_type == QuestionType.OPEN_ENDED:
+        # Consider complete if more than 50 characters; already-trimmed
+        # long texts skip the O(n) strip copy entirely
+        if len(text) >= 50 and not text[0].isspace() and not text[-1].isspace():
+            return 1.0
+        return min(1.0, len(text.strip()) / 50.0)
+
+    # For other types, presence of any response is significant
+    return 0.0 if text.isspace() else 0.8
+
+# Estimated minutes to finish, indexed by int(completion_pct * 10):
+# <50% needs more time, 50-79% a few minutes, >=80% nearly done
+_REMAINING_TIME_LUT = bytes((5, 5, 5, 5, 5, 3, 3, 3, 1, 1, 1))
+
+def _remaining_minutes(completion_pct: float) -> int:
+    """Estimated minutes to finish, from the completion percentage"""
+
+    return _REMAINING_TIME_LUT[min(10, int(completion_pct * 10))]
+
+class ResumptionContext(NamedTuple):
+    """Resumption state for a partial response
+
+    A compact record instead of a six-key dict; callers that hand it to
+    a client serialize via _asdict().
+    """
+
+    response_id: str
+    question_id: str
+    partial_content: Optional[str]
+    completion_percentage: float
+    resumption_url: str
+    expected_time_remaining: int
+
+# Resumption URL prefix joined once at import; per-response URL building
+# is then a single join over four segments instead of re-reading settings
+_RESUME_URL_PREFIX = settings.WEB_URL.rstrip("/") + "/questions/"
+
+def _resume_url(question_id: str, response_id: str) -> str:
+    return "".join((_RESUME_URL_PREFIX, question_id, "/resume/", response_id))
+
+# Constant resumption message body, formatted per recipient; unindented so
+# notifications don't carry source-level leading whitespace
+_RESUMPTION_TEMPLATE = (
+    "You started responding to a team question but didn't finish.\n\n"
+    'Your partial response: "{excerpt}..."\n\n'
+    "You can continue where you left off: {url}"
+)
+
+# Question-type processing and validation handlers, dispatched by a table
+# lookup instead of an elif ladder over QuestionType
+
+def _process_multiple_choice(
+    processed: Dict[str, Any], response_data: Dict[str, Any]
+) -> None:
+    if "selected_options" not in response_data:
+        processed["selected_options"] = [response_data.get("response_text")]
+
+def _process_scale(
+    processed: Dict[str, Any], response_data: Dict[str, Any]
+) -> None:
+    if "scale_value" not in response_data:
+        # Try to extract numeric value from text
+        text = (response_data.get("response_text") or "").strip()
+        processed["scale_value"] = _parse_scale_value(text)
+
+_TYPE_PROCESSORS: Dict[
+    QuestionType, Callable[[Dict[str, Any], Dict[str, Any]], None]
+] = {
+    QuestionType.MULTIPLE_CHOICE: _process_multiple_choice,
+    QuestionType.SCALE: _process_scale,
+}
+
+def _validate_open_ended(
+    validation: Dict[str, Any], response_data: Dict[str, Any]
+) -> None:
+    if (
+        not response_data.get("response_text")
+        or len(response_data["response_text"].strip()) < 5
+    ):
+        validation["issues"].append("Response too short for open-ended question")
+        validation["quality_score"] -= 0.3
+
+def _validate_multiple_choice(
+    validation: Dict[str, Any], response_data: Dict[str, Any]
+) -> None:
+    if not response_data.get("selected_options"):
+        validation["issues"].append(
+            "No options selected for multiple choice question"
+        )
+        validation["is_valid"] = False
+
+def _validate_scale(
+    validation: Dict[str, Any], response_data: Dict[str, Any]
+) -> None:
+    if response_data.get("scale_value") is None:
+        validation["issues"].append("No scale value provided")
+        validation["is_valid"] = False
+
+_TYPE_VALIDATORS: Dict[
+    QuestionType, Callable[[Dict[str, Any], Dict[str, Any]], None]
+] = {
+    QuestionType.OPEN_ENDED: _validate_open_ended,
+    QuestionType.MULTIPLE_CHOICE: _validate_multiple_choice,
+    QuestionType.SCALE: _validate_scale,
+}
+
+# Slack interaction payloads map action type to the processed field and
+# its value in one table lookup; the old chained .get calls allocated a
+# throwaway {} per miss on the webhook path
+_SLACK_ACTION_HANDLERS: Dict[
+    str, Callable[[Dict[str, Any]], Tuple[str, Any]]
+] = {
+    "radio_buttons": lambda action: (
+        "selected_options",
+        [action["selected_option"]["value"]],
+    ),
+    "static_select": lambda action: (
+        "scale_value",
+        float(action["selected_option"]["value"]),
+    ),
+}
+
+# Static Slack block fragments built once at import; per-send formatting
+# only patches in the dynamic fields
+_RESPOND_BUTTON_TEMPLATE = {
+    "type": "button",
+    "text": {"type": "plain_text", "text": "Respond"},
+    "style": "primary",
+}
+
+@lru_cache(maxsize=64)
+def _scale_options(scale_min: int, scale_max: int) -> Tuple[Dict[str, Any], ...]:
+    """Select options for a scale question, shared across identical ranges"""
+
+    return tuple(
+        {"text": {"type": "plain_text", "text": str(i)}, "value": str(i)}
+        for i in range(scale_min, scale_max + 1)
+    )
+
+_QUALITY_CRITERIA = """
+        Evaluate on these criteria:
+        1. Relevance to the question (0.0-1.0)
+        2. Completeness of answer (0.0-1.0)
+        3. Clarity and coherence (0.0-1.0)
+        4. Actionability (0.0-1.0)
+"""
+
+_QUALITY_RESULT_SHAPE = """
+        {
+            "quality_score": 0.0-1.0,
+            "relevance": 0.0-1.0,
+            "completeness": 0.0-1.0,
+            "clarity": 0.0-1.0,
+            "actionability": 0.0-1.0,
+            "issues": ["list of issues"],
+            "suggestions": ["list of improvement suggestions"]
+        }
+"""
+
+class _ChannelSendBatcher:
+    """Coalesces outbound channel sends and flushes them together
+
+    Reminder and resumption sweeps send one message per recipient, and
+    each used to be an independent await paying a full network round trip
+    in sequence. Submissions landing within a short window are drained as
+    a batch and dispatched concurrently, so sweep wallclock approaches the
+    slowest send per batch rather than the sum. The underlying service
+    wrappers only expose single-message APIs, so the flush overlaps sends
+    instead of collapsing them into one bulk call.
+    """
+
+    MAX_BATCH_SIZE = 64
+    BATCH_WINDOW_SECONDS = 0.005
+
+    def __init__(self, send: Callable[..., Any]):
+        self._send = send
+        self._queue: "asyncio.Queue" = asyncio.Queue()
+        self._worker: Optional["asyncio.Task"] = None
+
+    async def submit(self, *args: Any) -> Dict[str, Any]:
+        """Queue one send and wait for its result"""
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((args, future))
+
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._drain())
+
+        return await future
+
+    async def _drain(self) -> None:
+        while not self._queue.empty():
+            batch = [self._queue.get_nowait()]
+
+            while len(batch) < self.MAX_BATCH_SIZE:
+                try:
+                    batch.append(
+                        await asyncio.wait_for(
+                            self._queue.get(), timeout=self.BATCH_WINDOW_SECONDS
+                        )
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            results = await asyncio.gather(
+                *(self._send(*args) for args, _ in batch),
+                return_exceptions=True,
+            )
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+class _QualityAnalysisBatcher:
+    """Coalesces concurrent quality analyses into shared LLM calls
+
+    When a question draws many simultaneous responses, each coroutine used
+    to issue its own LLM request and wait a full round trip. Requests
+    landing within a short window are instead evaluated together in one
+    prompt, amortizing per-call provider overhead across the batch.
+    """
+
+    MAX_BATCH_SIZE = 16
+    BATCH_WINDOW_SECONDS = 0.025
+
+    def __init__(self):
+        self._queue: "asyncio.Queue" = asyncio.Queue()
+        self._worker: Optional["asyncio.Task"] = None
+        self._llm_service: Optional[LLMService] = None
+
+    @property
+    def llm_service(self) -> LLMService:
+        if self._llm_service is None:
+            self._llm_service = LLMService()
+        return self._llm_service
+
+    async def analyze(
+        self, response_text: str, question_text: str
+    ) -> Dict[str, Any]:
+        """Queue one analysis and wait for its (possibly batched) result"""
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((response_text, question_text, future))
+
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._drain())
+
+        return await future
+
+    async def _drain(self) -> None:
+        while not self._queue.empty():
+            batch = [self._queue.get_nowait()]
+
+            # Hold the batch open briefly so concurrent callers coalesce
+            while len(batch) < self.MAX_BATCH_SIZE:
+                try:
+                    batch.append(
+                        await asyncio.wait_for(
+                            self._queue.get(), timeout=self.BATCH_WINDOW_SECONDS
+                        )
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                if len(batch) == 1:
+                    results = [await self._analyze_single(*batch[0][:2])]
+                else:
+                    results = await self._analyze_batch(
+                        [(item[0], item[1]) for item in batch]
+                    )
+                for (_, _, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+            except Exception as exc:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+
+    async def _analyze_single(
+        self, response_text: str, question_text: str
+    ) -> Dict[str, Any]:
+        quality_prompt = f"""
+        Analyze the quality of this response to the given question:
+
+        Question: {question_text}
+        Response: {response_text}
+        {_QUALITY_CRITERIA}
+        Return JSON format:
+        {_QUALITY_RESULT_SHAPE}
+        """
+
+        analysis_text = await self.llm_service.generate_text(
+            prompt=quality_prompt, max_tokens=300
+        )
+        return json.loads(analysis_text.strip())
+
+    async def _analyze_batch(
+        self, pairs: List[Tuple[str, str]]
+    ) -> List[Dict[str, Any]]:
+        numbered_pairs = "\n".join(
+            f"        Pair {i + 1}:\n"
+            f"        Question: {question_text}\n"
+            f"        Response: {response_text}"
+            for i, (response_text, question_text) in enumerate(pairs)
+        )
+
+        batch_prompt = f"""
+        Analyze the quality of each of the following {len(pairs)} question/response pairs:
+
+{numbered_pairs}
+        {_QUALITY_CRITERIA}
+        Return a JSON array with one object per pair, in order:
+        [
+        {_QUALITY_RESULT_SHAPE}
+        ]
+        """
+
+        analysis_text = await self.llm_service.generate_text(
+            prompt=batch_prompt, max_tokens=300 * len(pairs)
+        )
+        results = json.loads(analysis_text.strip())
+
+        if not isinstance(results, list) or len(results) != len(pairs):
+            raise ValueError(
+                f"Expected {len(pairs)} quality analyses, got {len(results)}"
+            )
+
+        return results
+
+# Process-wide so concurrent collect_response calls coalesce regardless of
+# which service instance handled them
+_quality_batcher = _QualityAnalysisBatcher()
+
+class _ReminderLogBuffer:
+    """Ring buffer that batches reminder log entries off the event loop
+
+    Appends are plain deque pushes — no I/O, no await — and a background
+    task flushes the accumulated entries to the module logger every
+    100ms. Under a reminder storm this turns one write syscall per
+    reminder into one per flush window; the bounded buffer sheds the
+    oldest entries rather than growing without limit.
+    """
+
+    MAXLEN = 4096
+    FLUSH_INTERVAL_SECONDS = 0.1
+
+    def __init__(self) -> None:
+        self._entries: deque = deque(maxlen=self.MAXLEN)
+        self._flusher: Optional[asyncio.Task] = None
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        self._entries.append(entry)
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush())
+
+    async def _flush(self) -> None:
+        while self._entries:
+            await asyncio.sleep(self.FLUSH_INTERVAL_SECONDS)
+            batch = list(self._entries)
+            self._entries.clear()
+            if batch:
+                logger.info(
+                    "Sent %d reminder(s): %s",
+                    len(batch),
+                    json.dumps(batch, sort_keys=True, default=str),
+                )
+
+_reminder_log = _ReminderLogBuffer()
+
 class ResponseCollectionService:
     """Service for response collection and management across multiple channels"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, redis=None):
         self.db = db
+        self.redis = redis if redis is not None else redis_client
         self.llm_service = LLMService()
         self.communication_service = CommunicationService(db)
         self.slack_service = SlackService()
@@ -48,6 +464,18 @@ class ResponseCollectionService:
             "mobile": self._handle_mobile_response,
         }
 
+        # Outbound senders, dispatched by channel name like channel_handlers
+        self._send_handlers = {
+            "slack": self._send_slack_question,
+            "email": self._send_email_question,
+            "web": self._send_web_question,
+            "mobile": self._send_mobile_question,
+        }
+
+        # Reminder/resumption sends funnel through the batcher so sweeps
+        # overlap their network round trips
+        self._send_batcher = _ChannelSendBatcher(self._dispatch_channel_message)
+
     async def send_question_to_channel(
         self,
         question: GeneratedQuestion,
@@ -65,26 +493,14 @@ class ResponseCollectionService:
         )
 
         # Channel-specific sending
-        result = None
-        if channel == "slack":
-            result = await self._send_slack_question(
-                question, adapted_message, recipient_profile
-            )
-        elif channel == "email":
-            result = await self._send_email_question(
-                question, adapted_message, recipient_profile
-            )
-        elif channel == "web":
-            result = await self._send_web_question(
-                question, adapted_message, recipient_profile
-            )
-        elif channel == "mobile":
-            result = await self._send_mobile_question(
-                question, adapted_message, recipient_profile
-            )
-        else:
+        handler = self._send_handlers.get(channel)
+        if handler is None:
             raise ValueError(f"Unsupported channel: {channel}")
 
+        result = handler(question, adapted_message, recipient_profile)
+        if inspect.isawaitable(result):
+            result = await result
+
         # Update question with delivery information
         question.sent_at = datetime.utcnow()
         question.delivery_channel = channel
@@ -95,17 +511,87 @@ class ResponseCollectionService:
 
         return result
 
+    async def send_question_to_channels(
+        self, plan: List[Tuple[GeneratedQuestion, str, TeamMemberProfile]]
+    ) -> List[Any]:
+        """Send a batch of questions concurrently across channels
+
+        Each send is network-bound (message adaptation, Slack/email round
+        trips) and independent, so they overlap under a shared concurrency
+        cap instead of awaiting sequentially, and delivery bookkeeping is
+        written back in one bulk update rather than a commit per send.
+        """
+
+        # Cap concurrent sends to stay under channel rate limits
+        semaphore = asyncio.Semaphore(20)
+
+        async def _dispatch(
+            question: GeneratedQuestion, channel: str, profile: TeamMemberProfile
+        ) -> Dict[str, Any]:
+            async with semaphore:
+                adapted_message = (
+                    await self.communication_service.adapt_message_for_recipient(
+                        message=question.question_text,
+                        recipient_profile=profile,
+                        context=question.context,
+                        message_type="question",
+                    )
+                )
+
+                handler = self._send_handlers.get(channel)
+                if handler is None:
+                    raise ValueError(f"Unsupported channel: {channel}")
+
+                result = handler(question, adapted_message, profile)
+                if inspect.isawaitable(result):
+                    result = await result
+                await self._schedule_reminders(question, profile)
+                return result
+
+        results = await asyncio.gather(
+            *[_dispatch(q, c, p) for q, c, p in plan],
+            return_exceptions=True,
+        )
+
+        # One bulk write covers every successful send; failed sends keep
+        # their questions unsent for retry
+        sent_at = datetime.utcnow()
+        delivered = [
+            {"id": question.id, "sent_at": sent_at, "delivery_channel": channel}
+            for (question, channel, _), result in zip(plan, results)
+            if not isinstance(result, Exception)
+        ]
+        if delivered:
+            self.db.bulk_update_mappings(GeneratedQuestion, delivered)
+            self.db.commit()
+
+        return results
+
     async def collect_response(
         self,
         question_id: str,
         responder_id: str,
         response_data: Dict[str, Any],
         channel: str,
+        auto_commit: bool = True,
     ) -> QuestionResponse:
-        """Collect and process a response from any channel"""
+        """Collect and process a response from any channel
 
+        Callers that make further changes to the response pass
+        auto_commit=False and commit once at the end instead of paying a
+        commit here and another for their own update.
+        """
+
+        # Recipient and user arrive in the same round trip; validation and
+        # channel handling touch both, and a lazy load per response is the
+        # classic N+1
         question = (
             self.db.query(GeneratedQuestion)
+            .options(
+                joinedload(GeneratedQuestion.recipient).joinedload(
+                    TeamMemberProfile.user
+                )
+            )
             .filter(GeneratedQuestion.id == question_id)
             .first()
         )
@@ -113,9 +599,16 @@ class ResponseCollectionService:
         if not question:
             raise ValueError(f"Question not found: {question_id}")
 
-        # Check for existing response
+        # Check for existing response; question and responder come along in
+        # the same round trip because the resumption path reads
+        # response.question.question_type and response.responder's channel
+        # preferences, and a lazy load per partial response is an N+1
         existing_response = (
             self.db.query(QuestionResponse)
+            .options(
+                joinedload(QuestionResponse.question),
+                joinedload(QuestionResponse.responder),
+            )
             .filter(
                 and_(
                     QuestionResponse.question_id == question_id,
@@ -136,13 +629,18 @@ class ResponseCollectionService:
         if existing_response:
             # Update existing response
             existing_response = await self._update_existing_response(
-                existing_response, processed_data, validation_result
+                existing_response, processed_data, validation_result, auto_commit
             )
             return existing_response
         else:
             # Create new response
             new_response = await self._create_new_response(
-                question_id, responder_id, processed_data, validation_result, channel
+                question,
+                responder_id,
+                processed_data,
+                validation_result,
+                channel,
+                auto_commit,
             )
             return new_response
 
@@ -155,19 +653,17 @@ class ResponseCollectionService:
     ) -> QuestionResponse:
         """Handle partial response and enable resumption"""
 
-        # Create or update partial response
+        # Create or update partial response; the status change below rides
+        # in the same transaction, so this path commits once, not twice
         response = await self.collect_response(
-            question_id, responder_id, partial_data, channel
+            question_id, responder_id, partial_data, channel, auto_commit=False
         )
 
         response.status = ResponseStatus.PARTIAL
         self.db.commit()
 
-        # Generate resumption link/prompt
-        resumption_context = await self._generate_resumption_context(response)
-
-        # Send resumption notification based on channel preferences
-        await self._send_resumption_notification(response, resumption_context)
+        # Notify the responder so they can resume where they left off
+        await self._resume_one(response)
 
         return response
 
@@ -176,8 +672,15 @@ class ResponseCollectionService:
     ) -> Dict[str, Any]:
         """Send a reminder for an unanswered question"""
 
+        # Reminder checks and channel sends read question.recipient and
+        # recipient.user; eager-load both so the fan-out stays at one query
         question = (
             self.db.query(GeneratedQuestion)
+            .options(
+                joinedload(GeneratedQuestion.recipient).joinedload(
+                    TeamMemberProfile.user
+                )
+            )
             .filter(GeneratedQuestion.id == question_id)
             .first()
         )
@@ -247,81 +750,70 @@ class ResponseCollectionService:
     ) -> Dict[str, Any]:
         """Get comprehensive response analytics"""
 
-        # Build query
-        query = self.db.query(QuestionResponse)
-
-        if question_id:
-            query = query.filter(QuestionResponse.question_id == question_id)
-
-        if team_id:
-            query = (
-                query.join(GeneratedQuestion)
-                .join(TeamMemberProfile)
-                .filter(TeamMemberProfile.team_id == team_id)
+        # Counts and averages aggregate in the database; shipping every
+        # response row over just to sum statuses in Python scaled memory
+        # and CPU with the response volume
+        def _scoped(query):
+            if question_id:
+                query = query.filter(QuestionResponse.question_id == question_id)
+            if team_id:
+                query = (
+                    query.join(GeneratedQuestion)
+                    .join(TeamMemberProfile)
+                    .filter(TeamMemberProfile.team_id == team_id)
+                )
+            if start_date:
+                query = query.filter(QuestionResponse.created_at >= start_date)
+            if end_date:
+                query = query.filter(QuestionResponse.created_at <= end_date)
+            return query
+
+        totals = _scoped(
+            self.db.query(
+                func.count(QuestionResponse.id).label("total"),
+                func.count()
+                .filter(QuestionResponse.status == ResponseStatus.COMPLETED)
+                .label("completed"),
+                func.count()
+                .filter(QuestionResponse.status == ResponseStatus.PARTIAL)
+                .label("partial"),
+                func.avg(QuestionResponse.response_time_seconds).label(
+                    "avg_response_time"
+                ),
+                func.avg(QuestionResponse.quality_score).label("avg_quality"),
+                func.avg(QuestionResponse.sentiment_score).label("avg_sentiment"),
+                func.count()
+                .filter(QuestionResponse.is_anonymous)
+                .label("anonymous"),
+                func.count()
+                .filter(QuestionResponse.is_confidential)
+                .label("confidential"),
             )
+        ).one()
 
-        if start_date:
-            query = query.filter(QuestionResponse.created_at >= start_date)
-        if end_date:
-            query = query.filter(QuestionResponse.created_at <= end_date)
-
-        responses = query.all()
-
-        if not responses:
+        total_responses = totals.total or 0
+        if not total_responses:
             return {"total_responses": 0}
 
-        # Calculate analytics
-        total_responses = len(responses)
-        completed_responses = len(
-            [r for r in responses if r.status == ResponseStatus.COMPLETED]
-        )
-        partial_responses = len(
-            [r for r in responses if r.status == ResponseStatus.PARTIAL]
-        )
-
-        # Response times
-        response_times = [
-            r.response_time_seconds for r in responses if r.response_time_seconds
-        ]
-        avg_response_time = (
-            sum(response_times) / len(response_times) if response_times else 0
-        )
-
-        # Quality scores
-        quality_scores = [
-            r.quality_indicators.get("quality_score", 0.0)
-            for r in responses
-            if r.quality_indicators
-        ]
-        avg_quality = sum(quality_scores) / len(quality_scores) if quality_scores else 0
-
-        # Channel distribution
-        channel_distribution = {}
-        for response in responses:
-            channel = response.response_channel
-            channel_distribution[channel] = channel_distribution.get(channel, 0) + 1
-
-        # Sentiment analysis
-        sentiment_scores = [
-            r.sentiment_score for r in responses if r.sentiment_score is not None
-        ]
-        avg_sentiment = (
-            sum(sentiment_scores) / len(sentiment_scores) if sentiment_scores else 0
+        channel_rows = (
+            _scoped(
+                self.db.query(QuestionResponse.response_channel, func.count())
+            )
+            .group_by(QuestionResponse.response_channel)
+            .all()
         )
 
         return {
             "total_responses": total_responses,
-            "completed_responses": completed_responses,
-            "partial_responses": partial_responses,
-            "completion_rate": (
-                completed_responses / total_responses if total_responses > 0 else 0
-            ),
-            "avg_response_time_seconds": avg_response_time,
-            "avg_quality_score": avg_quality,
-            "avg_sentiment_score": avg_sentiment,
-            "channel_distribution": channel_distribution,
-            "anonymous_responses": len([r for r in responses if r.is_anonymous]),
-            "confidential_responses": len([r for r in responses if r.is_confidential]),
+            "completed_responses": totals.completed,
+            "partial_responses": totals.partial,
+            "completion_rate": totals.completed / total_responses,
+            "avg_response_time_seconds": totals.avg_response_time or 0,
+            "avg_quality_score": totals.avg_quality or 0,
+            "avg_sentiment_score": totals.avg_sentiment or 0,
+            "channel_distribution": dict(channel_rows),
+            "anonymous_responses": totals.anonymous,
+            "confidential_responses": totals.confidential,
         }
 
     # Private helper methods
@@ -366,7 +858,7 @@ class ResponseCollectionService:
 
         return result
 
-    async def _send_web_question(
+    def _send_web_question(
         self, question: GeneratedQuestion, message: str, recipient: TeamMemberProfile
     ) -> Dict[str, Any]:
         """Send question via web interface"""
@@ -393,7 +885,7 @@ class ResponseCollectionService:
             "notification_id": str(uuid.uuid4()),
         }
 
-    async def _send_mobile_question(
+    def _send_mobile_question(
         self, question: GeneratedQuestion, message: str, recipient: TeamMemberProfile
     ) -> Dict[str, Any]:
         """Send question via mobile push notification"""
@@ -431,27 +923,15 @@ class ResponseCollectionService:
         }
 
         # Question type specific processing
-        if question_type == QuestionType.MULTIPLE_CHOICE:
-            if "selected_options" not in response_data:
-                processed["selected_options"] = [response_data.get("response_text")]
-        elif question_type == QuestionType.SCALE:
-            if "scale_value" not in response_data:
-                # Try to extract numeric value from text
-                text = response_data.get("response_text", "")
-                try:
-                    processed["scale_value"] = float(text)
-                except Exception:
-                    processed["scale_value"] = None
+        processor = _TYPE_PROCESSORS.get(question_type)
+        if processor:
+            processor(processed, response_data)
 
         # Channel-specific processing
         if channel == "slack":
-            processed = await self._process_slack_response_data(
-                processed, response_data
-            )
+            processed = self._process_slack_response_data(processed, response_data)
         elif channel == "email":
-            processed = await self._process_email_response_data(
-                processed, response_data
-            )
+            processed = self._process_email_response_data(processed, response_data)
 
         return processed
 
@@ -467,28 +947,10 @@ class ResponseCollectionService:
             "suggestions": [],
         }
 
-        # Check completeness
-        if question.question_type == QuestionType.OPEN_ENDED:
-            if (
-                not response_data.get("response_text")
-                or len(response_data["response_text"].strip()) < 5
-            ):
-                validation["issues"].append(
-                    "Response too short for open-ended question"
-                )
-                validation["quality_score"] -= 0.3
-
-        elif question.question_type == QuestionType.MULTIPLE_CHOICE:
-            if not response_data.get("selected_options"):
-                validation["issues"].append(
-                    "No options selected for multiple choice question"
-                )
-                validation["is_valid"] = False
-
-        elif question.question_type == QuestionType.SCALE:
-            if response_data.get("scale_value") is None:
-                validation["issues"].append("No scale value provided")
-                validation["is_valid"] = False
+        # Check completeness per question type
+        validator = _TYPE_VALIDATORS.get(question.question_type)
+        if validator:
+            validator(validation, response_data)
 
         # Analyze response quality using LLM
         if response_data.get("response_text"):
@@ -511,13 +973,22 @@ class ResponseCollectionService:
         response: QuestionResponse,
         processed_data: Dict[str, Any],
         validation: Dict[str, Any],
+        auto_commit: bool = True,
     ) -> QuestionResponse:
         """Update an existing response"""
 
-        # Update fields
-        for field, value in processed_data.items():
-            if value is not None:
-                setattr(response, field, value)
+        # Bulk fields go through a direct UPDATE, skipping per-attribute
+        # instrumentation and change tracking; only the derived fields
+        # below are set on the instance
+        updates = {
+            field: value
+            for field, value in processed_data.items()
+            if value is not None
+        }
+        if updates:
+            self.db.query(QuestionResponse).filter(
+                QuestionResponse.id == response.id
+            ).update(updates, synchronize_session=False)
 
         # Update status
         if validation["is_valid"] and processed_data.get("response_text"):
@@ -527,6 +998,7 @@ class ResponseCollectionService:
             response.status = ResponseStatus.PARTIAL
 
         # Update quality indicators
+        response.quality_score = validation["quality_score"]
         response.quality_indicators = {
             "quality_score": validation["quality_score"],
             "validation_issues": validation["issues"],
@@ -535,23 +1007,30 @@ class ResponseCollectionService:
         }
 
         response.updated_at = datetime.utcnow()
-        self.db.commit()
-        self.db.refresh(response)
+        if auto_commit:
+            self.db.commit()
+            self.db.refresh(response)
+        else:
+            self.db.flush()
 
         return response
 
     async def _create_new_response(
         self,
-        question_id: str,
+        question: GeneratedQuestion,
         responder_id: str,
         processed_data: Dict[str, Any],
         validation: Dict[str, Any],
         channel: str,
+        auto_commit: bool = True,
     ) -> QuestionResponse:
         """Create a new response"""
 
+        # Assigning the relationship instead of question_id hydrates
+        # response.question from the object already loaded by the caller,
+        # so the resumption path needs no extra SELECT for a fresh row
         response = QuestionResponse(
-            question_id=question_id,
+            question=question,
             responder_id=responder_id,
             response_channel=channel,
             **processed_data,
@@ -565,6 +1044,7 @@ class ResponseCollectionService:
             response.status = ResponseStatus.PARTIAL
 
         # Set quality indicators
+        response.quality_score = validation["quality_score"]
         response.quality_indicators = {
             "quality_score": validation["quality_score"],
             "validation_issues": validation["issues"],
@@ -573,8 +1053,11 @@ class ResponseCollectionService:
         }
 
         self.db.add(response)
-        self.db.commit()
-        self.db.refresh(response)
+        if auto_commit:
+            self.db.commit()
+            self.db.refresh(response)
+        else:
+            self.db.flush()
 
         return response
 
@@ -608,28 +1091,39 @@ class ResponseCollectionService:
                 {"delay_hours": time_to_expiry - 2, "type": "gentle"}
             )
 
-        # Schedule with Celery (would integrate with actual task queue)
-        for reminder in reminder_schedule:
-            # celery_app.send_task(
-            #     "send_question_reminder",
-            #     args=[question.id, reminder["type"]],
-            #     countdown=reminder["delay_hours"] * 3600
-            # )
-            pass
+        if not reminder_schedule:
+            return
+
+        # Publish all reminders for the question in a single broker round
+        # trip; retry=False keeps the publish fire-and-forget so sending a
+        # question never blocks on per-reminder broker acks
+        group(
+            celery_app.signature(
+                "send_question_reminder",
+                args=[question.id, reminder["type"]],
+            ).set(countdown=int(reminder["delay_hours"] * 3600))
+            for reminder in reminder_schedule
+        ).apply_async(retry=False)
 
     async def _should_send_reminder(
         self, question: GeneratedQuestion
     ) -> Dict[str, Any]:
         """Check if a reminder should be sent"""
 
-        # Check if already answered
-        response = (
+        # Check if already answered; EXISTS returns a single boolean
+        # instead of hydrating a response row just to read its status
+        answered = self.db.query(
             self.db.query(QuestionResponse)
-            .filter(QuestionResponse.question_id == question.id)
-            .first()
-        )
+            .filter(
+                and_(
+                    QuestionResponse.question_id == question.id,
+                    QuestionResponse.status == ResponseStatus.COMPLETED,
+                )
+            )
+            .exists()
+        ).scalar()
 
-        if response and response.status == ResponseStatus.COMPLETED:
+        if answered:
             return {"should_remind": False, "reason": "Already answered"}
 
         # Check if expired
@@ -654,19 +1148,32 @@ class ResponseCollectionService:
     ) -> str:
         """Generate an appropriate reminder message"""
 
+        first_name = recipient.user.first_name if recipient.user else "Team Member"
+
+        # One generation serves every recipient sharing a communication
+        # profile: the name stays out of the prompt (as a placeholder) and
+        # is substituted per recipient, so a question with many unanswered
+        # recipients costs one LLM call per profile shape, not per person
+        cache_key = (
+            f"rem:{question.id}:{reminder_type}:{recipient.preferred_style}:"
+            f"{recipient.trust_level}:{recipient.role}"
+        )
+        cached = await self.redis.get(cache_key)
+        if cached:
+            return cached.replace("{name}", first_name)
+
         reminder_prompt = f"""
         Generate a {reminder_type} reminder message for an unanswered team question:
 
         Original Question: {question.question_text}
 
         Recipient Profile:
-        - Name: {recipient.user.first_name if recipient.user else "Team Member"}
         - Role: {recipient.role}
         - Trust Level: {recipient.trust_level}
         - Communication Style: {recipient.preferred_style}
 
         Reminder Type: {reminder_type}
-        Context: {json.dumps(question.context, indent=2)}
+        Context: {json.dumps(question.context, sort_keys=True)}
 
         Guidelines:
         - For "gentle" reminders: Be polite and understanding
@@ -674,6 +1181,7 @@ class ResponseCollectionService:
         - Keep it brief and actionable
         - Reference the original question context
         - Include a clear call to action
+        - Address the recipient with the literal placeholder {{name}}
 
         Generate only the reminder message.
         """
@@ -681,43 +1189,41 @@ class ResponseCollectionService:
         reminder_message = await self.llm_service.generate_text(
             prompt=reminder_prompt, max_tokens=150
         )
+        reminder_message = reminder_message.strip()
 
-        return reminder_message.strip()
+        # Cache until the question expires; after that no reminders go out
+        if question.expires_at:
+            ttl = int((question.expires_at - datetime.utcnow()).total_seconds())
+        else:
+            ttl = QUALITY_CACHE_TTL_SECONDS
+        if ttl > 0:
+            await self.redis.set(cache_key, reminder_message, ex=ttl)
+
+        return reminder_message.replace("{name}", first_name)
 
     async def _analyze_response_quality(
         self, response_text: str, question_text: str
     ) -> Dict[str, Any]:
         """Analyze response quality using LLM"""
 
-        quality_prompt = f"""
-        Analyze the quality of this response to the given question:
-
-        Question: {question_text}
-        Response: {response_text}
+        # Cache-aside on the (question, response) pair: a hit skips the
+        # slowest call on the collect_response path entirely
+        cache_key = "qa:" + hashlib.blake2b(
+            (question_text + "|" + response_text).encode("utf-8"), digest_size=16
+        ).hexdigest()
 
-        Evaluate on these criteria:
-        1. Relevance to the question (0.0-1.0)
-        2. Completeness of answer (0.0-1.0)
-        3. Clarity and coherence (0.0-1.0)
-        4. Actionability (0.0-1.0)
-
-        Return JSON format:
-        {{
-            "quality_score": 0.0-1.0,
-            "relevance": 0.0-1.0,
-            "completeness": 0.0-1.0,
-            "clarity": 0.0-1.0,
-            "actionability": 0.0-1.0,
-            "issues": ["list of issues"],
-            "suggestions": ["list of improvement suggestions"]
-        }}
-        """
+        cached = await self.redis.get(cache_key)
+        if cached:
+            return json.loads(cached)
 
         try:
-            analysis_text = await self.llm_service.generate_text(
-                prompt=quality_prompt, max_tokens=300
+            # Misses go through the shared batcher, which coalesces
+            # concurrent analyses into one LLM call
+            analysis = await _quality_batcher.analyze(response_text, question_text)
+            await self.redis.set(
+                cache_key, json.dumps(analysis), ex=QUALITY_CACHE_TTL_SECONDS
             )
-            return json.loads(analysis_text.strip())
+            return analysis
         except Exception:
             # Fallback basic analysis
             return {
@@ -780,13 +1286,7 @@ class ResponseCollectionService:
                                 "type": "plain_text",
                                 "text": f"Select {scale_min}-{scale_max}",
                             },
-                            "options": [
-                                {
-                                    "text": {"type": "plain_text", "text": str(i)},
-                                    "value": str(i),
-                                }
-                                for i in range(scale_min, scale_max + 1)
-                            ],
+                            "options": list(_scale_options(scale_min, scale_max)),
                         }
                     ],
                 }
@@ -798,10 +1298,8 @@ class ResponseCollectionService:
                 "type": "actions",
                 "elements": [
                     {
-                        "type": "button",
-                        "text": {"type": "plain_text", "text": "Respond"},
+                        **_RESPOND_BUTTON_TEMPLATE,
                         "action_id": f"open_response_{question.id}",
-                        "style": "primary",
                     }
                 ],
             }
@@ -814,11 +1312,19 @@ class ResponseCollectionService:
     ) -> Dict[str, str]:
         """Format question for email"""
 
+        # Computed once; the HTML and text bodies share both values
+        first_name = recipient.user.first_name if recipient.user else "Team Member"
+        expiry_str = (
+            question.expires_at.strftime("%Y-%m-%d %H:%M")
+            if question.expires_at
+            else "no deadline"
+        )
+
         html_content = f"""
         <html>
         <body>
             <h2>Team Question</h2>
-            <p>Hi {recipient.user.first_name if recipient.user else "Team Member"},</p>
+            <p>Hi {first_name},</p>
 
             <div style="background-color: #f5f5f5; padding: 15px; border-radius: 5px; margin: 20px 0;">
                 <p>{message}</p>
@@ -831,7 +1337,7 @@ class ResponseCollectionService:
                 </a>
             </p>
 
-            <p><small>This question will expire on {question.expires_at.strftime('%Y-%m-%d %H:%M') if question.expires_at else 'no deadline'}.</small></p>
+            <p><small>This question will expire on {expiry_str}.</small></p>
         </body>
         </html>
         """
@@ -839,13 +1345,13 @@ class ResponseCollectionService:
         text_content = f"""
         Team Question
 
-        Hi {recipient.user.first_name if recipient.user else "Team Member"},
+        Hi {first_name},
 
         {message}
 
         Please respond at: {settings.WEB_URL}/questions/{question.id}
 
-        This question expires on {question.expires_at.strftime('%Y-%m-%d %H:%M') if question.expires_at else 'no deadline'}.
+        This question expires on {expiry_str}.
         """
 
         return {"html": html_content, "text": text_content}
@@ -857,124 +1363,122 @@ class ResponseCollectionService:
         recipient: TeamMemberProfile,
         question: GeneratedQuestion,
     ) -> Dict[str, Any]:
-        """Send a message through the specified channel"""
+        """Send a message through the specified channel
 
-        if channel == "slack":
-            return await self._send_slack_question(question, message, recipient)
-        elif channel == "email":
-            return await self._send_email_question(question, message, recipient)
-        elif channel == "web":
-            return await self._send_web_question(question, message, recipient)
-        elif channel == "mobile":
-            return await self._send_mobile_question(question, message, recipient)
-        else:
+        Goes through the shared batcher so concurrent callers (reminder
+        and resumption sweeps) flush their sends together.
+        """
+
+        return await self._send_batcher.submit(channel, message, recipient, question)
+
+    async def _dispatch_channel_message(
+        self,
+        channel: str,
+        message: str,
+        recipient: TeamMemberProfile,
+        question: GeneratedQuestion,
+    ) -> Dict[str, Any]:
+        """Resolve the channel sender and deliver one message"""
+
+        handler = self._send_handlers.get(channel)
+        if handler is None:
             return {"error": f"Unsupported channel: {channel}"}
 
+        # Web and mobile senders are synchronous enqueue-and-return; only
+        # suspend when a handler actually hands back a coroutine
+        result = handler(question, message, recipient)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
     async def _log_reminder(
         self, question_id: str, reminder_type: str, result: Dict[str, Any]
     ) -> None:
         """Log reminder sending"""
 
-        # In a real implementation, would log to database or monitoring system
-        print(
-            f"Reminder sent for question {question_id}, type: {reminder_type}, result: {result}"
+        _reminder_log.append(
+            {
+                "timestamp": time.time(),
+                "question_id": question_id,
+                "reminder_type": reminder_type,
+                "result": result,
+            }
         )
 
     async def _generate_resumption_context(
         self, response: QuestionResponse
-    ) -> Dict[str, Any]:
+    ) -> ResumptionContext:
         """Generate context for resuming a partial response"""
 
-        return {
-            "response_id": response.id,
-            "question_id": response.question_id,
-            "partial_content": response.response_text,
-            "completion_percentage": self._calculate_completion_percentage(response),
-            "resumption_url": f"{settings.WEB_URL}/questions/{response.question_id}/resume/{response.id}",
-            "expected_time_remaining": self._estimate_remaining_time(response),
-        }
-
-    async def _send_resumption_notification(
-        self, response: QuestionResponse, context: Dict[str, Any]
-    ) -> None:
-        """Send notification to help user resume their response"""
-
-        question = response.question
-        recipient = response.responder
+        # One computation feeds both metrics; the old helpers each
+        # re-stripped the text and touched the question relationship
+        completion_pct = _completion_from(
+            response.response_text, response.question.question_type
+        )
 
-        resumption_message = f"""
-        You started responding to a team question but didn't finish.
+        return ResumptionContext(
+            response_id=response.id,
+            question_id=response.question_id,
+            partial_content=response.response_text,
+            completion_percentage=completion_pct,
+            resumption_url=_resume_url(response.question_id, response.id),
+            expected_time_remaining=_remaining_minutes(completion_pct),
+        )
 
-        Your partial response: "{response.response_text[:100]}..."
+    async def _resume_one(self, response: QuestionResponse) -> None:
+        """Send notification to help user resume their response
 
-        You can continue where you left off: {context['resumption_url']}
+        Formats and dispatches in one step; the send path only needs the
+        excerpt and URL, so the context dict the old two-step path built
+        per response is skipped. Callers that return resumption state as
+        JSON use _generate_resumption_context instead.
         """
 
-        # Send through preferred channel
-        preferred_channel = (
-            recipient.preferred_channels[0] if recipient.preferred_channels else "email"
+        # A partial save with no text yet would crash the unguarded slice
+        resumption_message = _RESUMPTION_TEMPLATE.format(
+            excerpt=(response.response_text or "")[:100],
+            url=_resume_url(response.question_id, response.id),
         )
+
+        # Send through preferred channel
         await self._send_channel_message(
-            preferred_channel, resumption_message, recipient, question
+            response.responder.primary_channel,
+            resumption_message,
+            response.responder,
+            response.question,
         )
 
-    def _calculate_completion_percentage(self, response: QuestionResponse) -> float:
-        """Calculate how complete a partial response is"""
-
-        if not response.response_text:
-            return 0.0
-
-        # Simple heuristic based on text length and question type
-        text_length = len(response.response_text.strip())
-
-        if response.question.question_type == QuestionType.OPEN_ENDED:
-            # Consider complete if more than 50 characters
-            return min(1.0, text_length / 50.0)
-        else:
-            # For other types, presence of any response is significant
-            return 0.8 if text_length > 0 else 0.0
-
-    def _estimate_remaining_time(self, response: QuestionResponse) -> int:
-        """Estimate remaining time to complete response in minutes"""
-
-        completion_pct = self._calculate_completion_percentage(response)
-
-        if completion_pct >= 0.8:
-            return 1  # Almost done, just need a minute
-        elif completion_pct >= 0.5:
-            return 3  # Partially done, few more minutes
-        else:
-            return 5  # Barely started, needs more time
-
-    async def _process_slack_response_data(
+    def _process_slack_response_data(
         self, processed: Dict[str, Any], raw_data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Process Slack-specific response data"""
 
         # Handle Slack interaction payloads
-        if "actions" in raw_data:
-            actions = raw_data["actions"]
-            if actions:
-                action = actions[0]
-                if action.get("type") == "radio_buttons":
-                    processed["selected_options"] = [
-                        action.get("selected_option", {}).get("value")
-                    ]
-                elif action.get("type") == "static_select":
-                    processed["scale_value"] = float(
-                        action.get("selected_option", {}).get("value", 0)
+        actions = raw_data.get("actions")
+        if actions:
+            action = actions[0]
+            handler = _SLACK_ACTION_HANDLERS.get(action.get("type"))
+            if handler:
+                try:
+                    field, value = handler(action)
+                except (KeyError, TypeError, ValueError):
+                    logger.warning(
+                        "Malformed Slack action payload: %s", action.get("type")
                     )
+                else:
+                    processed[field] = value
 
         return processed
 
-    async def _process_email_response_data(
+    def _process_email_response_data(
         self, processed: Dict[str, Any], raw_data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Process email-specific response data"""
 
-        # Handle email form submissions
-        if "form_data" in raw_data:
-            form_data = raw_data["form_data"]
-            processed.update(form_data)
+        # Handle email form submissions; single lookup instead of a
+        # membership test followed by a subscript
+        form_data = raw_data.get("form_data")
+        if form_data:
+            processed |= form_data
 
         return processed
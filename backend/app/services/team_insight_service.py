@@ -13,25 +13,261 @@ Synthesizes insights from team responses including:
 
 from typing import Any, Dict, List, Optional, Tuple
 
-import statistics
-from collections import Counter, defaultdict
+import asyncio
+import hashlib
+import heapq
+import json
+import re
+from collections import defaultdict
 from datetime import datetime, timedelta
 
-from sqlalchemy import and_, desc, func, or_
-from sqlalchemy.orm import Session
+import numpy as np
+
+from sqlalchemy import Text, and_, cast, desc, func, or_
+from sqlalchemy.dialects.postgresql import JSONB, array
+from sqlalchemy.orm import Session, contains_eager, selectinload
 
 from ..core.config import settings
+from ..core.database import redis_client
 from ..models.team_interrogation import (GeneratedQuestion, QuestionResponse,
                                          QuestionType, ResponseStatus,
                                          TeamInsight, TeamMemberProfile)
 from ..models.user import User
 from .llm_service import LLMService
 
+# Cap on concurrent per-question analyses so a team with many questions
+# doesn't flood the LLM backend when the insight loops fan out
+ANALYSIS_CONCURRENCY = 10
+
+# Insight runs, conflict detection, and consensus checks re-analyze the
+# same response sets; content-addressed results stay valid for a day
+INSIGHT_CACHE_TTL_SECONDS = 86400
+
+# Full consensus/conflict results are keyed on the latest response
+# timestamp, so they self-invalidate on new data; the short TTL just
+# bounds staleness of the timestamp probe itself
+ANALYSIS_RESULT_TTL_SECONDS = 60
+
+def _texts_cache_key(prefix: str, texts: List[str]) -> str:
+    """Content-addressed cache key for an LLM analysis of a text set"""
+
+    digest = hashlib.blake2b(
+        "\x1f".join(sorted(texts)).encode("utf-8"), digest_size=16
+    ).hexdigest()
+    return f"{prefix}:{digest}"
+
+# Coarse keyword vocabulary for theme extraction; stems are matched so
+# "productive"/"productivity" both count toward the same theme
+_THEME_KEYWORDS = {
+    "productivity": ("productiv", "efficien", "velocity", "output"),
+    "communication": ("communicat", "meeting", "feedback", "update", "sync"),
+    "workload": ("workload", "overload", "capacity", "burnout", "deadline"),
+    "team_dynamics": ("collaborat", "conflict", "morale", "trust", "team"),
+    "process": ("process", "workflow", "planning", "priorit"),
+    "tooling": ("tooling", "infrastructure", "automation", "environment"),
+}
+
+_KEYWORD_TO_THEME = {
+    keyword: theme
+    for theme, keywords in _THEME_KEYWORDS.items()
+    for keyword in keywords
+}
+
+# One compiled alternation scans each text in a single pass instead of
+# one substring search per keyword; longest-first ordering keeps matches
+# unambiguous when one stem prefixes another
+_THEME_PATTERN = re.compile(
+    "|".join(sorted(_KEYWORD_TO_THEME, key=len, reverse=True))
+)
+
+def _aggregate_choice_patterns(
+    responses: List[QuestionResponse],
+) -> Dict[str, Any]:
+    """Aggregate choice distribution for multiple-choice responses"""
+
+    # Track the running winner while counting; most_common(1) would sort
+    # the whole tally just to read back a maximum the loop already knows
+    choice_counts: Dict[str, int] = {}
+    top_choice = None
+    top_count = 0
+    for response in responses:
+        if response.selected_options:
+            for choice in response.selected_options:
+                count = choice_counts.get(choice, 0) + 1
+                choice_counts[choice] = count
+                if count > top_count:
+                    top_choice, top_count = choice, count
+
+    return {
+        "choice_distribution": choice_counts,
+        "most_popular_choice": (
+            (top_choice, top_count) if top_choice is not None else None
+        ),
+    }
+
+def _aggregate_scale_patterns(
+    responses: List[QuestionResponse],
+) -> Dict[str, Any]:
+    """Aggregate scale-value statistics for scale responses"""
+
+    scale_values = np.fromiter(
+        (r.scale_value for r in responses if r.scale_value is not None),
+        dtype=np.float32,
+    )
+    if not scale_values.size:
+        return {}
+
+    return {
+        "scale_distribution": {
+            "mean": float(scale_values.mean()),
+            "median": float(np.median(scale_values)),
+            "std": (
+                float(scale_values.std(ddof=1)) if scale_values.size > 1 else 0
+            ),
+            "min": float(scale_values.min()),
+            "max": float(scale_values.max()),
+        }
+    }
+
+# Per-type aggregate analyzers, resolved once per question instead of
+# walking an if/elif chain; open-ended stays inline since it awaits the
+# LLM text analysis
+_AGGREGATE_PATTERN_HANDLERS = {
+    QuestionType.MULTIPLE_CHOICE: _aggregate_choice_patterns,
+    QuestionType.SCALE: _aggregate_scale_patterns,
+}
+
+# Expected JSON shape for a single conflict analysis; shared between the
+# single and batched prompt variants
+_CONFLICT_RESULT_SHAPE = """{
+            "conflict_detected": true/false,
+            "conflict_intensity": 0.0-1.0,
+            "conflict_reasons": ["list of specific conflict indicators"],
+            "opposing_viewpoints": ["summary of different perspectives"]
+        }"""
+
+class _ConflictAnalysisBatcher:
+    """Coalesces concurrent text-conflict analyses into shared LLM calls
+
+    The conflict fan-out issues one LLM request per open-ended question;
+    requests landing within a short window are evaluated together in a
+    single prompt returning a JSON array, amortizing the shared
+    instructions across the batch.
+    """
+
+    MAX_BATCH_SIZE = 8
+    BATCH_WINDOW_SECONDS = 0.025
+
+    def __init__(self):
+        self._queue: "asyncio.Queue" = asyncio.Queue()
+        self._worker: Optional["asyncio.Task"] = None
+        self._llm_service: Optional[LLMService] = None
+
+    @property
+    def llm_service(self) -> LLMService:
+        if self._llm_service is None:
+            self._llm_service = LLMService()
+        return self._llm_service
+
+    async def analyze(self, combined_text: str) -> Dict[str, Any]:
+        """Queue one analysis and wait for its (possibly batched) result"""
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((combined_text, future))
+
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._drain())
+
+        return await future
+
+    async def _drain(self) -> None:
+        while not self._queue.empty():
+            batch = [self._queue.get_nowait()]
+
+            # Hold the batch open briefly so concurrent callers coalesce
+            while len(batch) < self.MAX_BATCH_SIZE:
+                try:
+                    batch.append(
+                        await asyncio.wait_for(
+                            self._queue.get(), timeout=self.BATCH_WINDOW_SECONDS
+                        )
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                if len(batch) == 1:
+                    results = [await self._analyze_single(batch[0][0])]
+                else:
+                    results = await self._analyze_batch(
+                        [item[0] for item in batch]
+                    )
+                for (_, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+
+    async def _analyze_single(self, combined_text: str) -> Dict[str, Any]:
+        conflict_prompt = f"""
+        Analyze these responses for potential conflicts or strong disagreements:
+
+        Responses:
+        {combined_text}
+
+        Return JSON:
+        {_CONFLICT_RESULT_SHAPE}
+        """
+
+        conflict_text = await self.llm_service.generate_text(
+            prompt=conflict_prompt, max_tokens=300
+        )
+        return json.loads(conflict_text.strip())
+
+    async def _analyze_batch(
+        self, combined_texts: List[str]
+    ) -> List[Dict[str, Any]]:
+        numbered_sets = "\n\n".join(
+            f"        Response set {i + 1}:\n{combined_text}"
+            for i, combined_text in enumerate(combined_texts)
+        )
+
+        batch_prompt = f"""
+        For each of the following {len(combined_texts)} response sets, analyze the
+        responses for potential conflicts or strong disagreements:
+
+{numbered_sets}
+
+        Return a JSON array with one object per response set, in order:
+        [
+        {_CONFLICT_RESULT_SHAPE}
+        ]
+        """
+
+        conflict_text = await self.llm_service.generate_text(
+            prompt=batch_prompt, max_tokens=300 * len(combined_texts)
+        )
+        results = json.loads(conflict_text.strip())
+
+        if not isinstance(results, list) or len(results) != len(combined_texts):
+            raise ValueError(
+                f"Expected {len(combined_texts)} conflict analyses, got {len(results)}"
+            )
+
+        return results
+
+# Process-wide so concurrent insight runs coalesce regardless of which
+# service instance issued them
+_conflict_batcher = _ConflictAnalysisBatcher()
+
 class TeamInsightService:
     """Service for synthesizing and aggregating team insights"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, redis=None):
         self.db = db
+        self.redis = redis if redis is not None else redis_client
         self.llm_service = LLMService()
 
     async def generate_insights_for_team(
@@ -52,27 +288,23 @@ class TeamInsightService:
 
         insights = []
 
-        # Generate different types of insights
-        insights.extend(
-            await self._generate_sentiment_insights(team_id, questions_with_responses)
+        # The five insight generators are independent and each mixes LLM
+        # calls with DB reads; run them concurrently so the endpoint pays
+        # for the slowest branch instead of the sum of all five
+        insight_batches = await asyncio.gather(
+            self._generate_sentiment_insights(team_id, questions_with_responses),
+            self._generate_consensus_insights(team_id, questions_with_responses),
+            self._generate_conflict_insights(team_id, questions_with_responses),
+            self._generate_trend_insights(team_id, questions_with_responses),
+            self._generate_thematic_insights(team_id, questions_with_responses),
         )
-        insights.extend(
-            await self._generate_consensus_insights(team_id, questions_with_responses)
-        )
-        insights.extend(
-            await self._generate_conflict_insights(team_id, questions_with_responses)
-        )
-        insights.extend(
-            await self._generate_trend_insights(team_id, questions_with_responses)
-        )
-        insights.extend(
-            await self._generate_thematic_insights(team_id, questions_with_responses)
-        )
-
-        # Store insights in database
-        for insight in insights:
-            self.db.add(insight)
+        for batch in insight_batches:
+            insights.extend(batch)
 
+        # Store insights in one multi-row INSERT instead of a unit-of-work
+        # flush per row; ids are client-generated so nothing needs to be
+        # read back
+        self.db.bulk_save_objects(insights, return_defaults=False)
         self.db.commit()
 
         return insights
@@ -124,6 +356,16 @@ class TeamInsightService:
     ) -> Dict[str, Any]:
         """Identify areas of team consensus and disagreement"""
 
+        cache_key = self._analysis_cache_key(
+            "cons", team_id, topic or "*", timeframe_days
+        )
+        try:
+            cached = await self.redis.get(cache_key)
+            if cached:
+                return json.loads(cached)
+        except Exception:
+            pass
+
         # Get relevant responses
         responses = await self._get_team_responses_by_topic(
             team_id, topic, timeframe_days
@@ -145,7 +387,9 @@ class TeamInsightService:
                 continue
 
             topic_analysis = await self._analyze_topic_consensus(
-                topic_key, topic_responses
+                topic_key,
+                topic_responses,
+                topic_responses[0].question.question_type,
             )
             consensus_analysis[topic_key] = topic_analysis
 
@@ -154,7 +398,7 @@ class TeamInsightService:
             consensus_analysis
         )
 
-        return {
+        result = {
             "team_id": team_id,
             "analysis_period": f"{timeframe_days} days",
             "topic_analyses": consensus_analysis,
@@ -164,11 +408,32 @@ class TeamInsightService:
             ),
         }
 
+        try:
+            await self.redis.set(
+                cache_key,
+                json.dumps(result, default=str),
+                ex=ANALYSIS_RESULT_TTL_SECONDS,
+            )
+        except Exception:
+            pass
+
+        return result
+
     async def detect_team_conflicts(
         self, team_id: str, sensitivity: float = 0.7, timeframe_days: int = 30
     ) -> Dict[str, Any]:
         """Detect potential conflicts or strong disagreements within the team"""
 
+        cache_key = self._analysis_cache_key(
+            "conf", team_id, str(sensitivity), timeframe_days
+        )
+        try:
+            cached = await self.redis.get(cache_key)
+            if cached:
+                return json.loads(cached)
+        except Exception:
+            pass
+
         responses = await self._get_team_responses_by_topic(
             team_id, None, timeframe_days
         )
@@ -188,7 +453,10 @@ class TeamInsightService:
                 continue
 
             conflict_analysis = await self._detect_question_conflicts(
-                question_id, question_responses, sensitivity
+                question_id,
+                question_responses,
+                sensitivity,
+                question_responses[0].question.question_type,
             )
 
             if conflict_analysis["conflict_detected"]:
@@ -197,7 +465,7 @@ class TeamInsightService:
         # Prioritize conflicts by severity
         conflicts.sort(key=lambda x: x["conflict_score"], reverse=True)
 
-        return {
+        result = {
             "team_id": team_id,
             "conflicts_detected": len(conflicts),
             "conflicts": conflicts,
@@ -207,6 +475,17 @@ class TeamInsightService:
             ),
         }
 
+        try:
+            await self.redis.set(
+                cache_key,
+                json.dumps(result, default=str),
+                ex=ANALYSIS_RESULT_TTL_SECONDS,
+            )
+        except Exception:
+            pass
+
+        return result
+
     async def track_sentiment_trends(
         self, team_id: str, timeframe_days: int = 90, granularity: str = "weekly"
     ) -> Dict[str, Any]:
@@ -215,57 +494,66 @@ class TeamInsightService:
         end_date = datetime.utcnow()
         start_date = end_date - timedelta(days=timeframe_days)
 
-        # Get responses with sentiment data
-        responses = (
-            self.db.query(QuestionResponse)
+        # Bucket and reduce in SQL; date_trunc groups server-side (weeks
+        # start Monday, matching the old Python bucketing) so only one
+        # aggregate row per period crosses the wire instead of raw rows
+        trunc_unit = {"daily": "day", "weekly": "week", "monthly": "month"}.get(
+            granularity, "day"
+        )
+        period = func.date_trunc(trunc_unit, QuestionResponse.created_at).label(
+            "period"
+        )
+        sentiment = QuestionResponse.sentiment_score
+
+        rows = (
+            self.db.query(
+                period,
+                func.count().label("response_count"),
+                func.avg(sentiment).label("avg_sentiment"),
+                func.stddev_samp(sentiment).label("sentiment_std"),
+                (func.max(sentiment) - func.min(sentiment)).label("sentiment_range"),
+                func.count().filter(sentiment > 0.1).label("positive_responses"),
+                func.count().filter(sentiment < -0.1).label("negative_responses"),
+            )
             .join(GeneratedQuestion)
             .join(TeamMemberProfile)
             .filter(
                 and_(
                     TeamMemberProfile.team_id == team_id,
-                    QuestionResponse.sentiment_score.isnot(None),
+                    sentiment.isnot(None),
                     QuestionResponse.created_at >= start_date,
                     QuestionResponse.status == ResponseStatus.COMPLETED,
                 )
             )
-            .order_by(QuestionResponse.created_at)
+            .group_by(period)
+            .order_by(period)
             .all()
         )
 
-        if not responses:
+        if not rows:
             return {"error": "No sentiment data found"}
 
-        # Group by time periods
-        time_groups = self._group_responses_by_time(responses, granularity)
-
-        trend_data = []
-        for period, period_responses in time_groups.items():
-            sentiment_scores = [
-                r.sentiment_score
-                for r in period_responses
-                if r.sentiment_score is not None
-            ]
-
-            if sentiment_scores:
-                period_analysis = {
-                    "period": period,
-                    "response_count": len(period_responses),
-                    "avg_sentiment": statistics.mean(sentiment_scores),
-                    "sentiment_std": (
-                        statistics.stdev(sentiment_scores)
-                        if len(sentiment_scores) > 1
-                        else 0
-                    ),
-                    "sentiment_range": max(sentiment_scores) - min(sentiment_scores),
-                    "positive_responses": len([s for s in sentiment_scores if s > 0.1]),
-                    "negative_responses": len(
-                        [s for s in sentiment_scores if s < -0.1]
-                    ),
-                    "neutral_responses": len(
-                        [s for s in sentiment_scores if -0.1 <= s <= 0.1]
-                    ),
-                }
-                trend_data.append(period_analysis)
+        period_format = "%Y-%m" if granularity == "monthly" else "%Y-%m-%d"
+
+        trend_data = [
+            {
+                "period": row.period.strftime(period_format),
+                "response_count": row.response_count,
+                "avg_sentiment": float(row.avg_sentiment),
+                "sentiment_std": (
+                    float(row.sentiment_std) if row.sentiment_std is not None else 0
+                ),
+                "sentiment_range": float(row.sentiment_range),
+                "positive_responses": row.positive_responses,
+                "negative_responses": row.negative_responses,
+                "neutral_responses": (
+                    row.response_count
+                    - row.positive_responses
+                    - row.negative_responses
+                ),
+            }
+            for row in rows
+        ]
 
         # Calculate trend direction
         trend_direction = await self._calculate_sentiment_trend_direction(trend_data)
@@ -290,30 +578,29 @@ class TeamInsightService:
         """Generate actionable recommendations based on team insights"""
 
         # Get recent insights
-        insights = (
-            self.db.query(TeamInsight)
-            .filter(
-                and_(
-                    TeamInsight.team_id == team_id,
-                    TeamInsight.confidence_score >= priority_threshold,
-                    TeamInsight.created_at >= datetime.utcnow() - timedelta(days=30),
-                )
+        query = self.db.query(TeamInsight).filter(
+            and_(
+                TeamInsight.team_id == team_id,
+                TeamInsight.confidence_score >= priority_threshold,
+                TeamInsight.created_at >= datetime.utcnow() - timedelta(days=30),
             )
-            .order_by(TeamInsight.confidence_score.desc())
-            .all()
         )
 
+        # Category filtering happens in SQL (?| array-overlap on the JSON
+        # themes, GIN-indexable) instead of hydrating every insight and
+        # scanning categories x themes in Python
+        if insight_categories:
+            query = query.filter(
+                cast(TeamInsight.key_themes, JSONB).has_any(
+                    array(insight_categories)
+                )
+            )
+
+        insights = query.order_by(TeamInsight.confidence_score.desc()).all()
+
         if not insights:
             return []
 
-        # Filter by categories if specified
-        if insight_categories:
-            insights = [
-                i
-                for i in insights
-                if any(cat in i.key_themes for cat in insight_categories)
-            ]
-
         recommendations = []
 
         for insight in insights:
@@ -333,15 +620,44 @@ class TeamInsightService:
 
     # Private helper methods
 
+    def _analysis_cache_key(
+        self, prefix: str, team_id: str, qualifier: str, timeframe_days: int
+    ) -> str:
+        """Cache key for a team-level analysis result
+
+        Embeds the team's latest completed-response timestamp so a new
+        response changes the key and stale entries are simply never read
+        again; no explicit invalidation is needed.
+        """
+
+        latest = (
+            self.db.query(func.max(QuestionResponse.created_at))
+            .join(GeneratedQuestion)
+            .join(TeamMemberProfile)
+            .filter(TeamMemberProfile.team_id == team_id)
+            .scalar()
+        )
+        stamp = latest.isoformat() if latest else "none"
+        return f"{prefix}:{team_id}:{qualifier}:{timeframe_days}:{stamp}"
+
     async def _get_team_questions_with_responses(
         self, team_id: str, start_date: datetime, end_date: datetime, min_responses: int
     ) -> List[Tuple[GeneratedQuestion, List[QuestionResponse]]]:
         """Get team questions that have enough responses for analysis"""
 
-        # Get questions for the team within timeframe
+        # Completed responses ride along via selectinload (one IN query
+        # over the question ids) instead of one response query per
+        # question, which was an N+1 on teams with many questions
         questions = (
             self.db.query(GeneratedQuestion)
             .join(TeamMemberProfile)
+            .options(
+                selectinload(
+                    GeneratedQuestion.responses.and_(
+                        QuestionResponse.status == ResponseStatus.COMPLETED
+                    )
+                )
+            )
             .filter(
                 and_(
                     TeamMemberProfile.team_id == team_id,
@@ -352,24 +668,11 @@ class TeamInsightService:
             .all()
         )
 
-        questions_with_responses = []
-
-        for question in questions:
-            responses = (
-                self.db.query(QuestionResponse)
-                .filter(
-                    and_(
-                        QuestionResponse.question_id == question.id,
-                        QuestionResponse.status == ResponseStatus.COMPLETED,
-                    )
-                )
-                .all()
-            )
-
-            if len(responses) >= min_responses:
-                questions_with_responses.append((question, responses))
-
-        return questions_with_responses
+        return [
+            (question, question.responses)
+            for question in questions
+            if len(question.responses) >= min_responses
+        ]
 
     async def _generate_sentiment_insights(
         self,
@@ -387,14 +690,20 @@ class TeamInsightService:
         for _, responses in questions_with_responses:
             all_responses.extend(responses)
 
-        sentiment_scores = [
-            r.sentiment_score for r in all_responses if r.sentiment_score is not None
-        ]
+        # Materialize the score array once; the insight builder and its
+        # detailed analysis both reduce over it
+        scores = np.fromiter(
+            (
+                r.sentiment_score
+                for r in all_responses
+                if r.sentiment_score is not None
+            ),
+            dtype=np.float32,
+        )
 
-        if sentiment_scores:
-            avg_sentiment = statistics.mean(sentiment_scores)
+        if scores.size:
             sentiment_insight = await self._create_sentiment_insight(
-                team_id, sentiment_scores, all_responses
+                team_id, scores, all_responses
             )
             insights.append(sentiment_insight)
 
@@ -411,11 +720,29 @@ class TeamInsightService:
 
         insights = []
 
-        for question, responses in questions_with_responses:
-            consensus_analysis = await self._analyze_topic_consensus(
-                question.question_text, responses
+        # Each per-question analysis is an independent LLM-backed call;
+        # overlap them under a shared concurrency cap instead of paying
+        # one round trip per question sequentially
+        semaphore = asyncio.Semaphore(ANALYSIS_CONCURRENCY)
+
+        async def _bounded_analysis(
+            question: GeneratedQuestion, responses: List[QuestionResponse]
+        ) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._analyze_topic_consensus(
+                    question.question_text, responses, question.question_type
+                )
+
+        analyses = await asyncio.gather(
+            *(
+                _bounded_analysis(question, responses)
+                for question, responses in questions_with_responses
             )
+        )
 
+        for (question, responses), consensus_analysis in zip(
+            questions_with_responses, analyses
+        ):
             if (
                 consensus_analysis["consensus_level"] > 0.7
                 or consensus_analysis["consensus_level"] < 0.3
@@ -438,11 +765,28 @@ class TeamInsightService:
 
         insights = []
 
-        for question, responses in questions_with_responses:
-            conflict_analysis = await self._detect_question_conflicts(
-                question.id, responses, sensitivity=0.6
+        # Same fan-out as consensus generation: conflict detection per
+        # question is independent, so overlap the calls under a cap
+        semaphore = asyncio.Semaphore(ANALYSIS_CONCURRENCY)
+
+        async def _bounded_detection(
+            question: GeneratedQuestion, responses: List[QuestionResponse]
+        ) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._detect_question_conflicts(
+                    question.id, responses, 0.6, question.question_type
+                )
+
+        analyses = await asyncio.gather(
+            *(
+                _bounded_detection(question, responses)
+                for question, responses in questions_with_responses
             )
+        )
 
+        for (question, responses), conflict_analysis in zip(
+            questions_with_responses, analyses
+        ):
             if conflict_analysis["conflict_detected"]:
                 insight = await self._create_conflict_insight(
                     team_id, question, responses, conflict_analysis
@@ -462,13 +806,15 @@ class TeamInsightService:
 
         insights = []
 
-        # Group responses by time periods
-        all_responses = []
-        for _, responses in questions_with_responses:
-            all_responses.extend(responses)
-
-        # Sort by creation time
-        all_responses.sort(key=lambda r: r.created_at)
+        # Each per-question list arrives ordered by created_at (relationship
+        # order_by), so an n-way merge produces the combined timeline in
+        # O(n log k) instead of concatenating and re-sorting from scratch
+        all_responses = list(
+            heapq.merge(
+                *(responses for _, responses in questions_with_responses),
+                key=lambda r: r.created_at,
+            )
+        )
 
         if len(all_responses) >= 10:  # Need enough data for trend analysis
             trend_insight = await self._create_trend_insight(team_id, all_responses)
@@ -510,30 +856,37 @@ class TeamInsightService:
     ) -> Dict[str, Any]:
         """Analyze individual response characteristics"""
 
-        response_lengths = [
-            len(r.response_text) if r.response_text else 0 for r in responses
-        ]
-        response_times = [
-            r.response_time_seconds for r in responses if r.response_time_seconds
-        ]
-        confidence_scores = [
-            r.confidence for r in responses if r.confidence is not None
-        ]
+        response_lengths = np.fromiter(
+            (len(r.response_text) if r.response_text else 0 for r in responses),
+            dtype=np.float32,
+        )
+        response_times = np.fromiter(
+            (
+                r.response_time_seconds
+                for r in responses
+                if r.response_time_seconds
+            ),
+            dtype=np.float32,
+        )
+        confidence_scores = np.fromiter(
+            (r.confidence for r in responses if r.confidence is not None),
+            dtype=np.float32,
+        )
 
         return {
             "response_count": len(responses),
             "avg_response_length": (
-                statistics.mean(response_lengths) if response_lengths else 0
+                float(response_lengths.mean()) if response_lengths.size else 0
             ),
             "avg_response_time_seconds": (
-                statistics.mean(response_times) if response_times else 0
+                float(response_times.mean()) if response_times.size else 0
             ),
             "avg_confidence": (
-                statistics.mean(confidence_scores) if confidence_scores else 0
+                float(confidence_scores.mean()) if confidence_scores.size else 0
             ),
             "response_length_variance": (
-                statistics.variance(response_lengths)
-                if len(response_lengths) > 1
+                float(response_lengths.var(ddof=1))
+                if response_lengths.size > 1
                 else 0
             ),
         }
@@ -543,38 +896,13 @@ class TeamInsightService:
     ) -> Dict[str, Any]:
         """Analyze aggregate patterns across responses"""
 
-        patterns = {}
+        handler = _AGGREGATE_PATTERN_HANDLERS.get(question.question_type)
+        if handler is not None:
+            return handler(responses)
 
-        if question.question_type == QuestionType.MULTIPLE_CHOICE:
-            # Analyze choice distribution
-            all_choices = []
-            for response in responses:
-                if response.selected_options:
-                    all_choices.extend(response.selected_options)
-
-            choice_counts = Counter(all_choices)
-            patterns["choice_distribution"] = dict(choice_counts)
-            patterns["most_popular_choice"] = (
-                choice_counts.most_common(1)[0] if choice_counts else None
-            )
-
-        elif question.question_type == QuestionType.SCALE:
-            # Analyze scale distribution
-            scale_values = [
-                r.scale_value for r in responses if r.scale_value is not None
-            ]
-            if scale_values:
-                patterns["scale_distribution"] = {
-                    "mean": statistics.mean(scale_values),
-                    "median": statistics.median(scale_values),
-                    "std": (
-                        statistics.stdev(scale_values) if len(scale_values) > 1 else 0
-                    ),
-                    "min": min(scale_values),
-                    "max": max(scale_values),
-                }
+        patterns = {}
 
-        elif question.question_type == QuestionType.OPEN_ENDED:
+        if question.question_type == QuestionType.OPEN_ENDED:
             # Analyze text patterns
             response_texts = [r.response_text for r in responses if r.response_text]
             if response_texts:
@@ -589,22 +917,23 @@ class TeamInsightService:
     ) -> Dict[str, Any]:
         """Analyze sentiment across responses"""
 
-        sentiment_scores = [
-            r.sentiment_score for r in responses if r.sentiment_score is not None
-        ]
+        scores = np.fromiter(
+            (r.sentiment_score for r in responses if r.sentiment_score is not None),
+            dtype=np.float32,
+        )
 
-        if not sentiment_scores:
+        if not scores.size:
             return {"error": "No sentiment data available"}
 
+        positive = int((scores > 0.1).sum())
+        negative = int((scores < -0.1).sum())
         return {
-            "avg_sentiment": statistics.mean(sentiment_scores),
-            "sentiment_std": (
-                statistics.stdev(sentiment_scores) if len(sentiment_scores) > 1 else 0
-            ),
-            "positive_count": len([s for s in sentiment_scores if s > 0.1]),
-            "negative_count": len([s for s in sentiment_scores if s < -0.1]),
-            "neutral_count": len([s for s in sentiment_scores if -0.1 <= s <= 0.1]),
-            "sentiment_range": max(sentiment_scores) - min(sentiment_scores),
+            "avg_sentiment": float(scores.mean()),
+            "sentiment_std": float(scores.std(ddof=1)) if scores.size > 1 else 0,
+            "positive_count": positive,
+            "negative_count": negative,
+            "neutral_count": scores.size - positive - negative,
+            "sentiment_range": float(np.ptp(scores)),
         }
 
     async def _calculate_response_quality_metrics(
@@ -612,23 +941,25 @@ class TeamInsightService:
     ) -> Dict[str, Any]:
         """Calculate quality metrics for responses"""
 
-        quality_scores = []
-        for response in responses:
-            if response.quality_indicators:
-                quality_scores.append(
-                    response.quality_indicators.get("quality_score", 0.0)
-                )
+        quality_scores = np.fromiter(
+            (
+                response.quality_indicators.get("quality_score", 0.0)
+                for response in responses
+                if response.quality_indicators
+            ),
+            dtype=np.float32,
+        )
 
-        if not quality_scores:
+        if not quality_scores.size:
             return {"error": "No quality data available"}
 
         return {
-            "avg_quality": statistics.mean(quality_scores),
+            "avg_quality": float(quality_scores.mean()),
             "quality_std": (
-                statistics.stdev(quality_scores) if len(quality_scores) > 1 else 0
+                float(quality_scores.std(ddof=1)) if quality_scores.size > 1 else 0
             ),
-            "high_quality_count": len([q for q in quality_scores if q > 0.7]),
-            "low_quality_count": len([q for q in quality_scores if q < 0.4]),
+            "high_quality_count": int((quality_scores > 0.7).sum()),
+            "low_quality_count": int((quality_scores < 0.4).sum()),
         }
 
     async def _get_team_responses_by_topic(
@@ -639,10 +970,14 @@ class TeamInsightService:
         end_date = datetime.utcnow()
         start_date = end_date - timedelta(days=timeframe_days)
 
+        # Consensus and conflict grouping read response.question per row;
+        # reuse the join already in place so the question comes back
+        # hydrated instead of lazy-loading once per response
         query = (
             self.db.query(QuestionResponse)
             .join(GeneratedQuestion)
             .join(TeamMemberProfile)
+            .options(contains_eager(QuestionResponse.question))
             .filter(
                 and_(
                     TeamMemberProfile.team_id == team_id,
@@ -653,18 +988,24 @@ class TeamInsightService:
         )
 
         if topic:
-            # Filter by topic in question context or text
+            # Filter by topic in question context or text; ILIKE over the
+            # text cast matches the trigram indexes instead of forcing a
+            # sequential scan per lookup
+            pattern = f"%{topic}%"
             query = query.filter(
                 or_(
-                    GeneratedQuestion.question_text.contains(topic),
-                    GeneratedQuestion.context.contains(topic),
+                    GeneratedQuestion.question_text.ilike(pattern),
+                    cast(GeneratedQuestion.context, Text).ilike(pattern),
                 )
             )
 
         return query.all()
 
     async def _analyze_topic_consensus(
-        self, topic: str, responses: List[QuestionResponse]
+        self,
+        topic: str,
+        responses: List[QuestionResponse],
+        question_type: QuestionType,
     ) -> Dict[str, Any]:
         """Analyze consensus level for a specific topic"""
 
@@ -672,14 +1013,15 @@ class TeamInsightService:
             return {"consensus_level": 0.0}
 
         # Analyze based on question type
-        question_type = responses[0].question.question_type
-
         if question_type == QuestionType.SCALE:
-            scale_values = [
-                r.scale_value for r in responses if r.scale_value is not None
-            ]
-            if scale_values:
-                std_dev = statistics.stdev(scale_values) if len(scale_values) > 1 else 0
+            scale_values = np.fromiter(
+                (r.scale_value for r in responses if r.scale_value is not None),
+                dtype=np.float32,
+            )
+            if scale_values.size:
+                std_dev = (
+                    float(scale_values.std(ddof=1)) if scale_values.size > 1 else 0
+                )
                 # Lower standard deviation = higher consensus
                 consensus_level = max(
                     0.0, 1.0 - (std_dev / 2.0)
@@ -688,27 +1030,34 @@ class TeamInsightService:
                 consensus_level = 0.0
 
         elif question_type == QuestionType.MULTIPLE_CHOICE:
-            all_choices = []
+            # Only the winning count matters here, so keep a running
+            # maximum instead of tallying into a Counter and sorting it
+            choice_counts: Dict[str, int] = {}
+            top_count = 0
             for response in responses:
                 if response.selected_options:
-                    all_choices.extend(response.selected_options)
+                    for choice in response.selected_options:
+                        count = choice_counts.get(choice, 0) + 1
+                        choice_counts[choice] = count
+                        if count > top_count:
+                            top_count = count
 
-            if all_choices:
-                choice_counts = Counter(all_choices)
-                most_common_count = choice_counts.most_common(1)[0][1]
-                consensus_level = most_common_count / len(responses)
-            else:
-                consensus_level = 0.0
+            consensus_level = top_count / len(responses) if top_count else 0.0
 
         else:  # Open-ended
             # Use sentiment analysis for consensus estimation
-            sentiment_scores = [
-                r.sentiment_score for r in responses if r.sentiment_score is not None
-            ]
-            if sentiment_scores:
+            sentiment_scores = np.fromiter(
+                (
+                    r.sentiment_score
+                    for r in responses
+                    if r.sentiment_score is not None
+                ),
+                dtype=np.float32,
+            )
+            if sentiment_scores.size:
                 sentiment_std = (
-                    statistics.stdev(sentiment_scores)
-                    if len(sentiment_scores) > 1
+                    float(sentiment_scores.std(ddof=1))
+                    if sentiment_scores.size > 1
                     else 0
                 )
                 consensus_level = max(0.0, 1.0 - sentiment_std)
@@ -728,40 +1077,44 @@ class TeamInsightService:
         }
 
     async def _detect_question_conflicts(
-        self, question_id: str, responses: List[QuestionResponse], sensitivity: float
+        self,
+        question_id: str,
+        responses: List[QuestionResponse],
+        sensitivity: float,
+        question_type: QuestionType,
     ) -> Dict[str, Any]:
         """Detect conflicts in responses to a specific question"""
 
         if len(responses) < 2:
             return {"conflict_detected": False, "conflict_score": 0.0}
 
-        question = responses[0].question
         conflict_indicators = []
         conflict_score = 0.0
 
         # Sentiment-based conflict detection
-        sentiment_scores = [
-            r.sentiment_score for r in responses if r.sentiment_score is not None
-        ]
-        if sentiment_scores:
-            sentiment_range = max(sentiment_scores) - min(sentiment_scores)
-            if sentiment_range > 1.0:  # Large sentiment variation
+        sentiment_scores = np.fromiter(
+            (r.sentiment_score for r in responses if r.sentiment_score is not None),
+            dtype=np.float32,
+        )
+        if sentiment_scores.size:
+            if float(np.ptp(sentiment_scores)) > 1.0:  # Large sentiment variation
                 conflict_indicators.append("High sentiment variation")
                 conflict_score += 0.3
 
         # Scale-based conflict detection
-        if question.question_type == QuestionType.SCALE:
-            scale_values = [
-                r.scale_value for r in responses if r.scale_value is not None
-            ]
-            if scale_values and len(scale_values) > 1:
-                scale_std = statistics.stdev(scale_values)
+        if question_type == QuestionType.SCALE:
+            scale_values = np.fromiter(
+                (r.scale_value for r in responses if r.scale_value is not None),
+                dtype=np.float32,
+            )
+            if scale_values.size > 1:
+                scale_std = float(scale_values.std(ddof=1))
                 if scale_std > 1.5:  # High disagreement on scale
                     conflict_indicators.append("High disagreement on rating scale")
                     conflict_score += 0.4
 
         # Text-based conflict detection using LLM
-        if question.question_type == QuestionType.OPEN_ENDED:
+        if question_type == QuestionType.OPEN_ENDED:
             response_texts = [r.response_text for r in responses if r.response_text]
             if len(response_texts) >= 2:
                 text_conflict_analysis = await self._analyze_text_conflicts(
@@ -791,15 +1144,13 @@ class TeamInsightService:
     async def _create_sentiment_insight(
         self,
         team_id: str,
-        sentiment_scores: List[float],
+        scores: "np.ndarray",
         responses: List[QuestionResponse],
     ) -> TeamInsight:
         """Create a sentiment-based team insight"""
 
-        avg_sentiment = statistics.mean(sentiment_scores)
-        sentiment_std = (
-            statistics.stdev(sentiment_scores) if len(sentiment_scores) > 1 else 0
-        )
+        avg_sentiment = float(scores.mean())
+        sentiment_std = float(scores.std(ddof=1)) if scores.size > 1 else 0
 
         # Determine sentiment trend
         if avg_sentiment > 0.3:
@@ -812,15 +1163,17 @@ class TeamInsightService:
         # Generate insight content
         title = f"Team Sentiment Analysis: {sentiment_label.title()} Overall Mood"
 
+        positive = int((scores > 0.1).sum())
+        negative = int((scores < -0.1).sum())
         summary = (
             f"Team sentiment analysis shows an average sentiment score of {avg_sentiment:.2f} "
-            f"with {len([s for s in sentiment_scores if s > 0.1])} positive responses, "
-            f"{len([s for s in sentiment_scores if s < -0.1])} negative responses, and "
-            f"{len([s for s in sentiment_scores if -0.1 <= s <= 0.1])} neutral responses."
+            f"with {positive} positive responses, "
+            f"{negative} negative responses, and "
+            f"{scores.size - positive - negative} neutral responses."
         )
 
         detailed_analysis = await self._generate_sentiment_detailed_analysis(
-            sentiment_scores, responses
+            scores, responses
         )
 
         recommendations = await self._generate_sentiment_recommendations(
@@ -841,7 +1194,7 @@ class TeamInsightService:
             ),
             sentiment_score=avg_sentiment,
             confidence_score=min(
-                1.0, len(sentiment_scores) / 10.0
+                1.0, scores.size / 10.0
             ),  # Higher confidence with more data
             recommendations=recommendations,
             priority_level="high" if abs(avg_sentiment) > 0.5 else "medium",
@@ -849,17 +1202,37 @@ class TeamInsightService:
         )
 
     async def _generate_sentiment_detailed_analysis(
-        self, sentiment_scores: List[float], responses: List[QuestionResponse]
+        self, scores: "np.ndarray", responses: List[QuestionResponse]
     ) -> str:
         """Generate detailed sentiment analysis"""
 
+        # Key on the rounded, order-independent score distribution so
+        # near-identical sentiment profiles share one cached narrative;
+        # the raw scores still feed the prompt on a miss
+        cache_key = "sd:" + hashlib.blake2b(
+            json.dumps(
+                {
+                    "scores": sorted(round(s, 2) for s in scores.tolist()),
+                    "n": len(responses),
+                }
+            ).encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
+
+        try:
+            cached = await self.redis.get(cache_key)
+            if cached:
+                return cached
+        except Exception:
+            pass
+
         analysis_prompt = f"""
         Generate a detailed analysis of team sentiment based on the following data:
 
-        Sentiment Scores: {sentiment_scores}
+        Sentiment Scores: {[round(s, 3) for s in scores.tolist()]}
         Number of Responses: {len(responses)}
-        Average Sentiment: {statistics.mean(sentiment_scores):.2f}
-        Sentiment Range: {max(sentiment_scores) - min(sentiment_scores):.2f}
+        Average Sentiment: {float(scores.mean()):.2f}
+        Sentiment Range: {float(np.ptp(scores)):.2f}
 
         Provide insights about:
         1. Overall team mood and engagement
@@ -873,8 +1246,16 @@ class TeamInsightService:
         analysis = await self.llm_service.generate_text(
             prompt=analysis_prompt, max_tokens=400
         )
+        analysis = analysis.strip()
 
-        return analysis.strip()
+        try:
+            await self.redis.set(
+                cache_key, analysis, ex=INSIGHT_CACHE_TTL_SECONDS
+            )
+        except Exception:
+            pass
+
+        return analysis
 
     async def _generate_sentiment_recommendations(
         self, avg_sentiment: float, sentiment_std: float
@@ -918,7 +1299,9 @@ class TeamInsightService:
     async def _analyze_text_patterns(self, response_texts: List[str]) -> Dict[str, Any]:
         """Analyze patterns in text responses using LLM"""
 
-        combined_text = "\n\n".join(response_texts[:10])  # Limit for token constraints
+        analyzed_texts = response_texts[:10]  # Limit for token constraints
+        combined_text = "\n\n".join(analyzed_texts)
+        cache_key = _texts_cache_key("tp", analyzed_texts)
 
         analysis_prompt = f"""
         Analyze these team responses for common patterns, themes, and insights:
@@ -937,10 +1320,18 @@ class TeamInsightService:
         """
 
         try:
+            cached = await self.redis.get(cache_key)
+            if cached:
+                return json.loads(cached)
+
             analysis_text = await self.llm_service.generate_text(
                 prompt=analysis_prompt, max_tokens=400
             )
-            return json.loads(analysis_text.strip())
+            result = json.loads(analysis_text.strip())
+            await self.redis.set(
+                cache_key, json.dumps(result), ex=INSIGHT_CACHE_TTL_SECONDS
+            )
+            return result
         except Exception:
             return {
                 "common_themes": [],
@@ -955,28 +1346,20 @@ class TeamInsightService:
     ) -> Dict[str, Any]:
         """Analyze conflicts in text responses using LLM"""
 
-        combined_text = "\n\n---\n\n".join(response_texts[:5])  # Limit for analysis
-
-        conflict_prompt = f"""
-        Analyze these responses for potential conflicts or strong disagreements:
-
-        Responses:
-        {combined_text}
-
-        Return JSON:
-        {{
-            "conflict_detected": true/false,
-            "conflict_intensity": 0.0-1.0,
-            "conflict_reasons": ["list of specific conflict indicators"],
-            "opposing_viewpoints": ["summary of different perspectives"]
-        }}
-        """
+        analyzed_texts = response_texts[:5]  # Limit for analysis
+        combined_text = "\n\n---\n\n".join(analyzed_texts)
+        cache_key = _texts_cache_key("tc", analyzed_texts)
 
         try:
-            conflict_text = await self.llm_service.generate_text(
-                prompt=conflict_prompt, max_tokens=300
+            cached = await self.redis.get(cache_key)
+            if cached:
+                return json.loads(cached)
+
+            result = await _conflict_batcher.analyze(combined_text)
+            await self.redis.set(
+                cache_key, json.dumps(result), ex=INSIGHT_CACHE_TTL_SECONDS
             )
-            return json.loads(conflict_text.strip())
+            return result
         except Exception:
             return {
                 "conflict_detected": False,
@@ -1047,13 +1430,43 @@ class TeamInsightService:
             "overall_change": sentiment_values[-1] - sentiment_values[0],
         }
 
+    def _deduplicate_recommendations(
+        self, recommendations: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Remove duplicate recommendations, keeping first occurrence order"""
+
+        # Hash a canonical serialization of each recommendation instead of
+        # comparing dicts pairwise; membership checks stay O(1) as the
+        # candidate list grows
+        seen = set()
+        unique = []
+
+        for recommendation in recommendations:
+            digest = hashlib.blake2b(
+                json.dumps(
+                    recommendation, sort_keys=True, default=str
+                ).encode("utf-8"),
+                digest_size=16,
+            ).digest()
+            if digest not in seen:
+                seen.add(digest)
+                unique.append(recommendation)
+
+        return unique
+
     # Additional helper methods would continue here...
     # Due to length constraints, I'm providing the core structure and key methods
 
     async def _extract_common_themes(self, response_texts: List[str]) -> List[str]:
         """Extract common themes from response texts"""
-        # Implementation would use LLM to identify themes
-        return ["productivity", "communication", "workload", "team_dynamics"]
+
+        theme_counts: Dict[str, int] = {}
+        for text in response_texts:
+            for match in _THEME_PATTERN.finditer(text.lower()):
+                theme = _KEYWORD_TO_THEME[match.group()]
+                theme_counts[theme] = theme_counts.get(theme, 0) + 1
+
+        return sorted(theme_counts, key=theme_counts.get, reverse=True)
 
     async def _create_consensus_insight(
         self,